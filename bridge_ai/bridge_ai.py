@@ -13,6 +13,7 @@ ARCHITECTURE:
 
 REQUIREMENTS:
     pip install pyaudio numpy google-generativeai
+    (optional) pip install orjson  # faster command encoding
 
     You also need:
     - Whisper.cpp installed with the base.en model
@@ -30,21 +31,38 @@ License: MIT
 =============================================================================
 """
 
+import functools
+import hashlib
 import json
+import re
+import selectors
+import shutil
 import socket
+import sqlite3
+import string
+import struct
 import sys
 import time
 import threading
+import unicodedata
 import queue
 import subprocess
 import tempfile
 import os
-import wave
-import struct
-from typing import Optional, Dict, Any
-from dataclasses import dataclass, asdict
+import http.client
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Callable
+from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
+try:
+    import orjson  # Optional: faster JSON encoding (pip install orjson)
+except ImportError:
+    orjson = None
+
 # =============================================================================
 # CONFIGURATION - Adjust these settings as needed
 # =============================================================================
@@ -55,15 +73,35 @@ class Config:
     # Network Settings
     GODOT_HOST = "127.0.0.1"  # localhost - Godot runs on same machine
     GODOT_PORT = 5005         # TCP port for Godot communication
+    ACK_REQUIRED = False      # Wait for Godot's acknowledgment before reporting success
+    ACK_TIMEOUT = 5.0         # Seconds to wait for an acknowledgment when required
+    RECONNECT_MAX_DELAY = 30.0  # Longest pause between background reconnect attempts
+    RECONNECT_WAIT = 0.2      # Seconds a send waits for the reconnector before failing
 
     # Whisper Settings
-    WHISPER_MODEL = "base.en"  # Smaller, faster model
+    WHISPER_BACKEND = "whisper.cpp"  # "whisper.cpp" or "faster-whisper" (in-process, pip install faster-whisper)
+    WHISPER_MODEL = "base.en"  # Smaller, faster model ("tiny.en-q5_1" / "distil-small.en" are faster still)
+    WHISPER_QUANTIZATION = "q5_1"  # Prefer ggml-<model>-<quant>.bin when present (None to disable)
     WHISPER_CPP_PATH = "/Users/siddharth/whisper.cpp/build/bin/whisper-cli"  # Path to whisper.cpp executable
     # Common paths: macOS Homebrew: /usr/local/bin/whisper-cpp or /opt/homebrew/bin/whisper-cpp
     # If you built from source, it might be: ~/whisper.cpp/main
+    WHISPER_SERVER_PATH = None  # whisper-server executable (None = next to WHISPER_CPP_PATH)
+    WHISPER_SERVER_PORT = 8081  # Local port for the persistent whisper.cpp server
+    WHISPER_SERVER_STARTUP_TIMEOUT = 30  # Seconds to wait for the server to load the model
+    WHISPER_THREADS = None  # Inference threads (None = all cores but one)
+    WHISPER_DEVICE = "auto"  # faster-whisper only: "cuda", "cpu" or "auto" (GPU when one is available)
+    WHISPER_COMPUTE_TYPE = None  # faster-whisper only (None = "int8_float16" on GPU, "int8" on CPU)
 
     # Gemini Settings
     GEMINI_MODEL = "gemini-2.5-flash"  # Fast and free tier available
+    GEMINI_WARMUP = True  # Send a 1-token request at startup so the first command is warm
+    RESPONSE_CACHE_ENABLED = True  # Reuse Gemini interpretations of repeated commands
+    RESPONSE_CACHE_SIZE = 512  # Remembered Gemini interpretations (repeated commands skip the API)
+    RESPONSE_CACHE_PATH = os.path.expanduser("~/.cache/bridge_ai/responses.sqlite")  # Keep them across sessions (None to disable)
+    RESPONSE_CACHE_MAX_AGE_DAYS = 30  # Saved interpretations unused this long are dropped at startup
+    SEMANTIC_CACHE_ENABLED = False  # Also reuse interpretations of near-identical phrasings
+    SEMANTIC_CACHE_THRESHOLD = 0.92  # Cosine similarity needed for a semantic cache hit
+    SEMANTIC_CACHE_SIZE = 1024  # Phrasings kept in the semantic cache
 
     # Audio Settings
     SAMPLE_RATE = 16000       # 16kHz - required by Whisper
@@ -72,10 +110,26 @@ class Config:
     SILENCE_THRESHOLD = 500   # Volume level below which is considered silence
     SILENCE_DURATION = 1.5    # Seconds of silence before processing speech
     MAX_RECORD_SECONDS = 10   # Maximum recording length
+    VAD_BACKEND = "rms"       # "rms" (volume threshold) or "webrtc" (pip install webrtcvad)
+    VAD_AGGRESSIVENESS = 2    # webrtc only: 0 (least) - 3 (most aggressive at rejecting noise)
+    VAD_SILENCE_DURATION = 0.5  # webrtc only: seconds of non-speech before processing
+
+    # Derived audio constants (chunks per silence window / per recording)
+    CHUNKS_FOR_SILENCE = int(SILENCE_DURATION * SAMPLE_RATE / CHUNK_SIZE)
+    VAD_CHUNKS_FOR_SILENCE = max(1, int(VAD_SILENCE_DURATION * SAMPLE_RATE / CHUNK_SIZE))
+    MAX_CHUNKS = int(MAX_RECORD_SECONDS * SAMPLE_RATE / CHUNK_SIZE)
 
     # Confidence Settings
     MIN_CONFIDENCE = 0.3      # Minimum confidence to accept a command (0.0 - 1.0)
 
+    # Pipeline Settings
+    PIPELINE_QUEUE_DEPTH = 2  # Recorded utterances waiting to be processed
+    PARTIAL_TRANSCRIPTION = False  # Transcribe while still speaking and show the partial text
+    PARTIAL_INTERVAL = 1.0    # Seconds of new audio between partial transcriptions
+    SPECULATIVE_PARSE = False  # With partials on, interpret them early so a matching final is instant
+                               # (costs a Gemini request per partial - counts against the daily quota)
+    SPECULATIVE_WAIT = 5.0    # Seconds a final parse waits for an early interpretation of the same words
+
 
 # =============================================================================
 # DATA STRUCTURES - Define the format of commands
@@ -121,13 +175,36 @@ class Intent(Enum):
     VIEWSCREEN = "viewscreen"          # On screen
 
 
-@dataclass
+# Lookup sets for validation, built once from the enums
+_VALID_DEPARTMENTS = frozenset(d.value for d in Department)
+_VALID_INTENTS = frozenset(i.value for i in Intent)
+
+# JSON schema Gemini's output is constrained to, built from the same enums
+_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "department": {"type": "string", "enum": [d.value for d in Department]},
+        "intent": {"type": "string", "enum": [i.value for i in Intent]},
+        "target": {"type": "string", "nullable": True},
+        "warp_factor": {"type": "number", "nullable": True},
+        "impulse_percent": {"type": "number", "nullable": True},
+        "maneuver": {"type": "string", "nullable": True},
+        "confidence": {"type": "number"},
+    },
+    "required": ["department", "intent", "confidence"],
+}
+
+
+@dataclass(frozen=True, slots=True)
 class BridgeCommand:
     """
     Structured command to send to Godot.
 
     This is the exact JSON schema that Godot expects.
     All commands must conform to this structure.
+
+    Commands are immutable (and slotted, so no per-instance __dict__), which
+    makes it safe to cache and reuse the same instance across commands.
     """
     department: str           # Which department handles this (helm, tactical, etc.)
     intent: str               # What action to take (navigate, warp, etc.)
@@ -136,44 +213,78 @@ class BridgeCommand:
     impulse_percent: Optional[float] # Impulse as percentage (0 - 100)
     maneuver: Optional[str]   # Special maneuver (e.g., "evasive pattern alpha")
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert command to a plain dict (fields are all scalars, so no deep copy)."""
+        return {
+            "department": self.department,
+            "intent": self.intent,
+            "target": self.target,
+            "warp_factor": self.warp_factor,
+            "impulse_percent": self.impulse_percent,
+            "maneuver": self.maneuver,
+        }
+
     def to_json(self) -> str:
         """Convert command to JSON string for sending over TCP."""
-        return json.dumps(asdict(self))
+        if orjson is not None:
+            return orjson.dumps(self.to_dict()).decode('utf-8')
+        return json.dumps(self.to_dict())
 
-    def is_valid(self) -> bool:
+    def to_bytes(self) -> bytes:
+        """Encode command as one newline-terminated TCP frame (cached per command)."""
+        return _encode_frame(self)
+
+    def is_valid(self, verbose: bool = True) -> bool:
         """
         Validate that the command has all required fields and valid values.
 
+        Args:
+            verbose: Print why an invalid command was rejected
+
         Returns:
             True if command is valid, False otherwise
         """
         # Check department is valid
-        valid_departments = [d.value for d in Department]
-        if self.department not in valid_departments:
-            print(f"  [INVALID] Unknown department: {self.department}")
+        if self.department not in _VALID_DEPARTMENTS:
+            if verbose:
+                print(f"  [INVALID] Unknown department: {self.department}")
             return False
 
         # Check intent is valid
-        valid_intents = [i.value for i in Intent]
-        if self.intent not in valid_intents:
-            print(f"  [INVALID] Unknown intent: {self.intent}")
+        if self.intent not in _VALID_INTENTS:
+            if verbose:
+                print(f"  [INVALID] Unknown intent: {self.intent}")
             return False
 
         # Validate warp factor if present
         if self.warp_factor is not None:
             if not (0 < self.warp_factor < 10):
-                print(f"  [INVALID] Warp factor must be between 0 and 10: {self.warp_factor}")
+                if verbose:
+                    print(f"  [INVALID] Warp factor must be between 0 and 10: {self.warp_factor}")
                 return False
 
         # Validate impulse percent if present
         if self.impulse_percent is not None:
             if not (0 <= self.impulse_percent <= 100):
-                print(f"  [INVALID] Impulse must be between 0 and 100: {self.impulse_percent}")
+                if verbose:
+                    print(f"  [INVALID] Impulse must be between 0 and 100: {self.impulse_percent}")
                 return False
 
         return True
 
 
+@functools.lru_cache(maxsize=256)
+def _encode_frame(command: BridgeCommand) -> bytes:
+    """
+    Encode a command as a TCP frame. Commands are immutable and hashable and
+    the same few repeat constantly ("full impulse", "raise shields"), so the
+    bytes are memoized instead of re-serialized on every send.
+    """
+    if orjson is not None:
+        return orjson.dumps(command.to_dict()) + b"\n"
+    return (json.dumps(command.to_dict()) + "\n").encode('utf-8')
+
+
 # =============================================================================
 # COMMAND MEMORY - Remember context from previous commands
 # =============================================================================
@@ -187,6 +298,8 @@ class CommandMemory:
     - "Increase to warp 7" (remembers we're in warp)
     """
 
+    NO_CONTEXT = "No previous context"
+
     def __init__(self):
         self.last_destination: Optional[str] = None
         self.last_warp_factor: Optional[float] = None
@@ -218,6 +331,16 @@ class CommandMemory:
         elif command.intent == Intent.LOWER_SHIELDS.value:
             self.shields_raised = False
 
+    def signature(self) -> tuple:
+        """
+        Cheap key for the state that get_context_string() describes.
+
+        Two memories with the same signature produce the same LLM context,
+        so it can be used to key cached interpretations.
+        """
+        return (self.last_destination, self.last_warp_factor or None,
+                self.at_warp, self.shields_raised)
+
     def get_context_string(self) -> str:
         """Get memory context for the LLM prompt."""
         context = []
@@ -229,13 +352,33 @@ class CommandMemory:
             context.append("Ship is currently at warp")
         if self.shields_raised:
             context.append("Shields are currently raised")
-        return "; ".join(context) if context else "No previous context"
+        return "; ".join(context) if context else self.NO_CONTEXT
 
 
 # =============================================================================
 # AUDIO RECORDING - Capture voice from microphone
 # =============================================================================
 
+def _wav_header(n_bytes: int, sample_rate: int = Config.SAMPLE_RATE,
+                channels: int = Config.CHANNELS, bits: int = 16) -> bytes:
+    """
+    Build the 44-byte header of a PCM WAV file.
+
+    Args:
+        n_bytes: Length of the PCM data that follows the header
+
+    Returns:
+        Header bytes; prepend to the raw audio to get a complete WAV file
+    """
+    block_align = channels * bits // 8
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + n_bytes, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate, sample_rate * block_align, block_align, bits,
+        b"data", n_bytes,
+    )
+
+
 class AudioRecorder:
     """
     Records audio from the microphone and detects when speech ends.
@@ -248,8 +391,28 @@ class AudioRecorder:
         self.sample_rate = Config.SAMPLE_RATE
         self.channels = Config.CHANNELS
         self.chunk_size = Config.CHUNK_SIZE
-        self.audio_queue = queue.Queue()
+        self.audio_queue: "queue.Queue[bytes]" = queue.Queue()  # Filled by the PortAudio callback
         self.is_recording = False
+        self._stop_requested = threading.Event()
+
+        # Silence threshold expressed as a sum of squares over one full chunk,
+        # so the per-chunk check can skip the square root entirely
+        self._silence_energy = Config.SILENCE_THRESHOLD ** 2 * self.chunk_size * self.channels
+
+        # Optional WebRTC voice activity detector. It needs 10/20/30 ms frames,
+        # so chunk remainders are carried over into the next chunk.
+        self.vad = None
+        self._vad_frame_bytes = self.sample_rate * 30 // 1000 * 2  # 30 ms of 16-bit mono
+        self._vad_carry = b""
+        if Config.VAD_BACKEND == "webrtc":
+            try:
+                import webrtcvad
+                if self.channels != 1:
+                    raise ValueError("webrtcvad needs mono audio")
+                self.vad = webrtcvad.Vad(Config.VAD_AGGRESSIVENESS)
+            except (ImportError, ValueError) as e:
+                print(f"WARNING: WebRTC VAD unavailable ({e}), using volume threshold")
+                print("  Install with: pip install webrtcvad")
 
         # Try to import pyaudio
         try:
@@ -262,80 +425,141 @@ class AudioRecorder:
             print("  On Ubuntu: sudo apt-get install portaudio19-dev && pip install pyaudio")
             sys.exit(1)
 
-    def _get_volume(self, data: bytes) -> float:
-        """Calculate the volume (RMS) of an audio chunk."""
-        # Convert bytes to integers
-        count = len(data) // 2
-        shorts = struct.unpack(f"{count}h", data)
-
-        # Calculate RMS (Root Mean Square)
-        sum_squares = sum(s * s for s in shorts)
-        rms = (sum_squares / count) ** 0.5
-        return rms
-
-    def record_until_silence(self) -> Optional[bytes]:
+    def _on_audio(self, in_data, frame_count, time_info, status):
+        """
+        PortAudio callback (runs on PortAudio's thread): hand each captured
+        chunk to the recording loop. Capture never waits on our processing.
+        """
+        self.audio_queue.put(in_data)
+        return (None, self.pyaudio.paContinue)
+
+    def _get_energy(self, data: bytes) -> int:
+        """Calculate the energy (sum of squared samples) of an audio chunk."""
+        # View the bytes as 16-bit samples (no copy), widen to avoid overflow
+        samples = np.frombuffer(data, dtype=np.int16).astype(np.int64)
+        return int(samples.dot(samples))
+
+    def _is_speech(self, data: bytes) -> bool:
+        """Decide whether an audio chunk contains speech."""
+        if self.vad is None:
+            return self._get_energy(data) > self._silence_energy
+
+        # Speech if any complete 30 ms frame in the chunk is speech
+        audio = self._vad_carry + data
+        frame = self._vad_frame_bytes
+        end = len(audio) - len(audio) % frame
+        self._vad_carry = audio[end:]
+        return any(self.vad.is_speech(audio[i:i + frame], self.sample_rate)
+                   for i in range(0, end, frame))
+
+    def record_until_silence(self, on_partial: Optional[Callable[[bytes], None]] = None) -> Optional[bytes]:
         """
         Record audio until the user stops speaking.
 
+        Args:
+            on_partial: Optional callback given the audio recorded so far,
+                every Config.PARTIAL_INTERVAL seconds while speech continues.
+                Must return quickly - it runs on the recording loop.
+
         Returns:
-            Raw audio bytes, or None if recording failed
+            Raw audio bytes, or None if no speech was heard
+
+        Raises:
+            OSError: If the microphone could not be opened
         """
         print("\n[LISTENING] Speak your command...")
 
+        # Drop anything left over from a previous recording
+        self._drain_audio_queue()
+
         try:
             stream = self.pa.open(
                 format=self.pyaudio.paInt16,
                 channels=self.channels,
                 rate=self.sample_rate,
                 input=True,
-                frames_per_buffer=self.chunk_size
+                frames_per_buffer=self.chunk_size,
+                stream_callback=self._on_audio
             )
         except Exception as e:
-            print(f"ERROR: Could not open microphone: {e}")
-            return None
+            # Raised, not returned as None, so callers don't retry at full speed
+            raise OSError(f"Could not open microphone: {e}") from e
 
-        frames = []
         silence_chunks = 0
         speech_started = False
-        chunks_for_silence = int(Config.SILENCE_DURATION * self.sample_rate / self.chunk_size)
-        max_chunks = int(Config.MAX_RECORD_SECONDS * self.sample_rate / self.chunk_size)
+        chunks_for_silence = Config.VAD_CHUNKS_FOR_SILENCE if self.vad else Config.CHUNKS_FOR_SILENCE
+        self._vad_carry = b""
+        max_chunks = Config.MAX_CHUNKS
+        partial_chunks = max(1, int(Config.PARTIAL_INTERVAL * self.sample_rate / self.chunk_size))
+        chunks_since_partial = 0
+
+        # Preallocate the whole recording window (16-bit samples) and fill it
+        # in place, rather than collecting chunks in a list and joining them
+        bytes_per_frame = 2 * self.channels
+        buffer = bytearray(max_chunks * self.chunk_size * bytes_per_frame)
+        length = 0
 
         try:
-            for _ in range(max_chunks):
-                data = stream.read(self.chunk_size, exception_on_overflow=False)
-                volume = self._get_volume(data)
+            chunks = 0
+            while chunks < max_chunks:
+                if self._stop_requested.is_set():
+                    break
+                try:
+                    data = self.audio_queue.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                chunks += 1
 
-                if volume > Config.SILENCE_THRESHOLD:
+                if self._is_speech(data):
                     # Speech detected
                     speech_started = True
                     silence_chunks = 0
-                    frames.append(data)
+                    buffer[length:length + len(data)] = data
+                    length += len(data)
                 elif speech_started:
                     # Silence after speech
-                    frames.append(data)
+                    buffer[length:length + len(data)] = data
+                    length += len(data)
                     silence_chunks += 1
 
                     if silence_chunks >= chunks_for_silence:
                         # Enough silence - stop recording
                         break
+
+                if on_partial and speech_started:
+                    chunks_since_partial += 1
+                    if chunks_since_partial >= partial_chunks:
+                        chunks_since_partial = 0
+                        on_partial(bytes(memoryview(buffer)[:length]))
         finally:
             stream.stop_stream()
             stream.close()
+            self._drain_audio_queue()
 
-        if not frames:
+        if not length:
             print("  [NO AUDIO] No speech detected")
             return None
 
-        print(f"  [RECORDED] {len(frames) * self.chunk_size / self.sample_rate:.1f} seconds")
-        return b''.join(frames)
+        print(f"  [RECORDED] {length / bytes_per_frame / self.sample_rate:.1f} seconds")
+        return bytes(memoryview(buffer)[:length])
+
+    def _drain_audio_queue(self):
+        """Discard captured chunks that were not consumed."""
+        try:
+            while True:
+                self.audio_queue.get_nowait()
+        except queue.Empty:
+            pass
 
     def save_to_wav(self, audio_data: bytes, filepath: str):
         """Save raw audio bytes to a WAV file."""
-        with wave.open(filepath, 'wb') as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(2)  # 16-bit = 2 bytes
-            wf.setframerate(self.sample_rate)
-            wf.writeframes(audio_data)
+        with open(filepath, 'wb') as f:
+            f.write(_wav_header(len(audio_data), self.sample_rate, self.channels))
+            f.write(audio_data)
+
+    def stop(self):
+        """Ask an in-progress recording (possibly on another thread) to finish."""
+        self._stop_requested.set()
 
     def cleanup(self):
         """Release audio resources."""
@@ -346,21 +570,74 @@ class AudioRecorder:
 # SPEECH-TO-TEXT - Convert audio to text using Whisper.cpp
 # =============================================================================
 
+# whisper-cli builds without stdin support fail to open the input "-"
+# ("error: failed to read WAV file '-'", "error: input file not found '-'")
+_RE_CLI_NO_STDIN = re.compile(rb"(?:failed to (?:read|open)|not found)[^\n]*'-'")
+
+
 class WhisperTranscriber:
     """
     Transcribes audio to text using Whisper.cpp.
 
     Whisper.cpp is a C++ implementation of OpenAI's Whisper model that runs
     entirely offline on your local machine.
+
+    When whisper-server is available it is started once and kept running, so
+    the model is loaded a single time instead of on every command. Otherwise
+    whisper-cli is run per command.
+
+    With WHISPER_BACKEND = "faster-whisper" the model runs in-process instead
+    and is fed the recorded samples directly, with no WAV or subprocess.
     """
 
     def __init__(self):
         self.model = Config.WHISPER_MODEL
         self.whisper_path = Config.WHISPER_CPP_PATH
+        self.server_process: Optional[subprocess.Popen] = None
+        self._server_conn: Optional[http.client.HTTPConnection] = None  # Kept alive between commands
+        self._cli_reads_stdin = True  # Cleared if this whisper-cli build rejects "-f -"
+        self.fw_model = None  # faster-whisper model when that backend is selected
+        self._lock = threading.Lock()  # One transcription at a time (shared server connection)
+        # whisper.cpp defaults to 4 threads; use the machine's cores instead,
+        # leaving one free for audio capture
+        self._threads = Config.WHISPER_THREADS or max(1, (os.cpu_count() or 2) - 1)
+
+        if Config.WHISPER_BACKEND == "faster-whisper":
+            self._init_faster_whisper()
+            return
 
         # Try to find whisper.cpp
         self._find_whisper()
 
+        # Keep the model loaded in a long-lived server process
+        self._start_server()
+
+    def _init_faster_whisper(self):
+        """Load the faster-whisper (CTranslate2) model in-process."""
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            print("ERROR: faster-whisper not installed.")
+            print("  Install with: pip3 install faster-whisper")
+            print("  Or set Config.WHISPER_BACKEND = \"whisper.cpp\"")
+            sys.exit(1)
+
+        device = Config.WHISPER_DEVICE
+        if device == "auto":
+            try:
+                import ctranslate2  # Installed with faster-whisper
+                device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+            except Exception:
+                device = "cpu"
+        # int8 weights with float16 activations is the fast path on GPU;
+        # plain int8 on CPU
+        compute_type = Config.WHISPER_COMPUTE_TYPE or (
+            "int8_float16" if device == "cuda" else "int8")
+
+        self.fw_model = WhisperModel(self.model, device=device, compute_type=compute_type,
+                                     cpu_threads=self._threads)
+        print(f"[WHISPER] faster-whisper loaded, using model: {self.model} ({device}, {compute_type})")
+
     def _find_whisper(self):
         """Locate the whisper.cpp executable."""
         # Common installation paths
@@ -381,6 +658,14 @@ class WhisperTranscriber:
                 print(f"[WHISPER] Found at: {expanded_path}")
                 return
 
+        # Fall back to whatever is on PATH
+        for cmd in ("whisper-cli", "whisper-cpp"):
+            found = shutil.which(cmd)  # PATH lookup only - nothing is executed
+            if found:
+                self.whisper_path = found
+                print(f"[WHISPER] Found on PATH: {found}")
+                return
+
         print("WARNING: whisper.cpp not found. Speech-to-text may not work.")
         print("  Checked paths:")
         for p in possible_paths:
@@ -388,29 +673,111 @@ class WhisperTranscriber:
         print("  Install with: brew install whisper-cpp (macOS)")
         print("  Or build from: https://github.com/ggerganov/whisper.cpp")
 
-    def _command_exists(self, cmd: str) -> bool:
-        """Check if a command exists in PATH."""
+    def _start_server(self):
+        """Launch whisper-server and wait until it has loaded the model."""
+        server_path = Config.WHISPER_SERVER_PATH or os.path.join(
+            os.path.dirname(self.whisper_path), "whisper-server")
+        server_path = os.path.expanduser(server_path)
+        model_path = self._find_model_path()
+
+        if not os.path.isfile(server_path) or not model_path:
+            print("[WHISPER] whisper-server not found, using whisper-cli per command")
+            return
+
+        # Something else already listening there would answer our readiness
+        # probe and then fail every transcription
         try:
-            subprocess.run([cmd, "--help"], capture_output=True, timeout=5)
-            return True
-        except:
-            return False
+            socket.create_connection(("127.0.0.1", Config.WHISPER_SERVER_PORT), timeout=0.5).close()
+            print(f"[WHISPER] Port {Config.WHISPER_SERVER_PORT} is already in use, using whisper-cli per command")
+            return
+        except OSError:
+            pass
 
-    def _find_model_path(self) -> Optional[str]:
-        """Find the Whisper model file."""
-        model_filename = f"ggml-{self.model}.bin"
+        try:
+            self.server_process = subprocess.Popen(
+                [
+                    server_path,
+                    "-m", model_path,
+                    "--host", "127.0.0.1",
+                    "--port", str(Config.WHISPER_SERVER_PORT),
+                    "-l", "en",
+                    "-t", str(self._threads),
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            print(f"[WHISPER] Could not start whisper-server: {e}")
+            return
+
+        # Wait for the health check, making sure it is our process answering
+        deadline = time.time() + Config.WHISPER_SERVER_STARTUP_TIMEOUT
+        while time.time() < deadline:
+            if self.server_process.poll() is not None:
+                print(f"[WHISPER] whisper-server exited (code {self.server_process.returncode})")
+                self.server_process = None
+                return
+            if self._server_ready() and self.server_process.poll() is None:
+                print(f"[WHISPER] Server ready on port {Config.WHISPER_SERVER_PORT}")
+                return
+            time.sleep(0.2)
 
-        possible_paths = [
-            os.path.expanduser(f"~/.cache/whisper/{model_filename}"),
-            os.path.expanduser(f"~/whisper.cpp/models/{model_filename}"),
-            f"/usr/local/share/whisper/{model_filename}",
-            f"/opt/homebrew/share/whisper/{model_filename}",
-            os.path.join(os.path.dirname(self.whisper_path), "models", model_filename),
-        ]
+        print("[WHISPER] whisper-server did not start in time, using whisper-cli per command")
+        self._stop_server()
 
-        for path in possible_paths:
-            if os.path.isfile(path):
-                return path
+    def _server_ready(self) -> bool:
+        """
+        Probe whisper-server's health endpoint. It answers 503 while the
+        model loads and 200 once ready; builds without /health (404) only
+        start listening after the model is loaded.
+        """
+        conn = http.client.HTTPConnection("127.0.0.1", Config.WHISPER_SERVER_PORT, timeout=0.5)
+        try:
+            conn.request("GET", "/health")
+            response = conn.getresponse()
+            response.read()
+            return response.status in (200, 404)
+        except (http.client.HTTPException, OSError):
+            return False
+        finally:
+            conn.close()
+
+    def _stop_server(self):
+        """Terminate the whisper-server process if it is running."""
+        if self._server_conn:
+            self._server_conn.close()
+            self._server_conn = None
+        if self.server_process:
+            self.server_process.terminate()
+            try:
+                self.server_process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.server_process.kill()
+            self.server_process = None
+
+    def _server_running(self) -> bool:
+        """Check whether the persistent whisper-server is still alive."""
+        return self.server_process is not None and self.server_process.poll() is None
+
+    def _find_model_path(self) -> Optional[str]:
+        """Find the Whisper model file, preferring a quantized variant."""
+        model_filenames = [f"ggml-{self.model}.bin"]
+        if Config.WHISPER_QUANTIZATION:
+            # Quantized weights move far fewer bytes per decode step on CPU
+            model_filenames.insert(0, f"ggml-{self.model}-{Config.WHISPER_QUANTIZATION}.bin")
+
+        for model_filename in model_filenames:
+            possible_paths = [
+                os.path.expanduser(f"~/.cache/whisper/{model_filename}"),
+                os.path.expanduser(f"~/whisper.cpp/models/{model_filename}"),
+                f"/usr/local/share/whisper/{model_filename}",
+                f"/opt/homebrew/share/whisper/{model_filename}",
+                os.path.join(os.path.dirname(self.whisper_path), "models", model_filename),
+            ]
+
+            for path in possible_paths:
+                if os.path.isfile(path):
+                    return path
 
         return None
 
@@ -426,53 +793,12 @@ class WhisperTranscriber:
         """
         print("[TRANSCRIBING] Converting speech to text...")
 
-        # Save audio to temporary file
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            tmp_path = tmp.name
-
         try:
-            # Save audio as WAV
-            with wave.open(tmp_path, 'wb') as wf:
-                wf.setnchannels(Config.CHANNELS)
-                wf.setsampwidth(2)
-                wf.setframerate(Config.SAMPLE_RATE)
-                wf.writeframes(audio_data)
-
-            # Find model
-            model_path = self._find_model_path()
-
-            # Build whisper.cpp command
-            cmd = [self.whisper_path]
-
-            if model_path:
-                cmd.extend(["-m", model_path])
-            else:
-                print("  [ERROR] No model found!")
-                return None
-
-            cmd.extend([
-                "-f", tmp_path,
-                "--no-timestamps",
-                "-l", "en",  # English
-            ])
-
-            # Run whisper.cpp
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-
-            if result.returncode != 0:
-                print(f"  [ERROR] Whisper failed (code {result.returncode})")
-                print(f"  [STDERR] {result.stderr}")
-                print(f"  [STDOUT] {result.stdout}")
+            with self._lock:
+                text = self._run_backend(audio_data)
+            if text is None:
                 return None
 
-            # Parse output
-            text = result.stdout.strip()
-
             # Clean up the text
             text = text.replace("[BLANK_AUDIO]", "").strip()
 
@@ -489,11 +815,164 @@ class WhisperTranscriber:
         except Exception as e:
             print(f"  [ERROR] Transcription failed: {e}")
             return None
+
+    def transcribe_partial(self, audio_data: bytes) -> Optional[str]:
+        """
+        Quietly transcribe the audio recorded so far, while the speaker may
+        still be talking. Skipped (returns None) if a transcription is
+        already running. Partials share the backend with the final
+        transcription, so one still running when the speaker stops delays
+        the final one until it finishes (at most one partial pass).
+
+        Args:
+            audio_data: Raw audio bytes recorded so far (16-bit PCM, 16kHz, mono)
+
+        Returns:
+            Partial text, or None if busy, empty or failed
+        """
+        if not self._lock.acquire(blocking=False):
+            return None
+        try:
+            text = self._run_backend(audio_data)
+        except Exception:
+            return None
+        finally:
+            self._lock.release()
+
+        if text is None:
+            return None
+        return text.replace("[BLANK_AUDIO]", "").strip() or None
+
+    def _run_backend(self, audio_data: bytes) -> Optional[str]:
+        """Transcribe with whichever backend is configured (raw, uncleaned text)."""
+        if self.fw_model is not None:
+            return self._transcribe_faster_whisper(audio_data)
+        return self._transcribe_whisper_cpp(audio_data)
+
+    def _transcribe_whisper_cpp(self, audio_data: bytes) -> Optional[str]:
+        """Transcribe via whisper-server, falling back to whisper-cli."""
+        # Build the WAV in memory - it never needs to touch the disk
+        wav_bytes = _wav_header(len(audio_data)) + audio_data
+
+        if self._server_running():
+            try:
+                return self._transcribe_server(wav_bytes)
+            except (http.client.HTTPException, OSError) as e:
+                print(f"  [WARNING] whisper-server request failed: {e}")
+
+        return self._transcribe_cli(wav_bytes)
+
+    def _transcribe_faster_whisper(self, audio_data: bytes) -> str:
+        """Transcribe raw 16-bit PCM with the in-process faster-whisper model."""
+        samples = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
+        segments, _ = self.fw_model.transcribe(samples, language="en", vad_filter=True)
+        return "".join(segment.text for segment in segments)
+
+    def _transcribe_server(self, wav_bytes: bytes) -> str:
+        """Send WAV bytes to the persistent whisper-server and return the text."""
+        boundary = "BridgeAIWhisperBoundary"
+        body = (
+            f"--{boundary}\r\n"
+            'Content-Disposition: form-data; name="response_format"\r\n\r\n'
+            "text\r\n"
+            f"--{boundary}\r\n"
+            'Content-Disposition: form-data; name="file"; filename="command.wav"\r\n'
+            "Content-Type: audio/wav\r\n\r\n"
+        ).encode('utf-8') + wav_bytes + f"\r\n--{boundary}--\r\n".encode('utf-8')
+
+        headers = {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+
+        # Reuse one keep-alive connection. The server may have closed it while
+        # idle between commands, so retry once on a fresh connection.
+        for attempt in range(2):
+            reused = self._server_conn is not None
+            if not reused:
+                self._server_conn = http.client.HTTPConnection(
+                    "127.0.0.1", Config.WHISPER_SERVER_PORT, timeout=30)
+            try:
+                self._server_conn.request("POST", "/inference", body=body, headers=headers)
+                response = self._server_conn.getresponse()
+                text = response.read().decode('utf-8', errors='replace')
+            except (http.client.HTTPException, OSError):
+                self._server_conn.close()
+                self._server_conn = None
+                if reused and attempt == 0:
+                    continue
+                raise
+
+            if response.status != 200:
+                raise http.client.HTTPException(f"whisper-server returned HTTP {response.status}")
+            return text
+
+    def _transcribe_cli(self, wav_bytes: bytes) -> Optional[str]:
+        """Run whisper-cli once on the WAV bytes (fed via stdin when supported)."""
+        # Find model
+        model_path = self._find_model_path()
+
+        # Build whisper.cpp command
+        cmd = [self.whisper_path]
+
+        if model_path:
+            cmd.extend(["-m", model_path])
+        else:
+            print("  [ERROR] No model found!")
+            return None
+
+        cmd.extend([
+            "--no-timestamps",
+            "-l", "en",  # English
+            "-t", str(self._threads),
+        ])
+
+        # stderr is captured on every run, so a failure can be explained (and
+        # a build without stdin support recognized) without running again
+        if self._cli_reads_stdin:
+            result = subprocess.run(
+                cmd + ["-f", "-"],  # Read audio from stdin
+                input=wav_bytes,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                timeout=30
+            )
+            if result.returncode != 0 and _RE_CLI_NO_STDIN.search(result.stderr):
+                # Older whisper.cpp builds can't read stdin - use a temp file
+                print("  [WHISPER] whisper-cli can't read stdin, using a temp file instead")
+                self._cli_reads_stdin = False
+
+        if not self._cli_reads_stdin:
+            result = self._run_cli_with_file(cmd, wav_bytes)
+
+        if result.returncode != 0:
+            print(f"  [ERROR] Whisper failed (code {result.returncode})")
+            print(f"  [STDERR] {result.stderr.decode('utf-8', errors='replace')}")
+            print(f"  [STDOUT] {result.stdout.decode('utf-8', errors='replace')}")
+            return None
+
+        return result.stdout.decode('utf-8', errors='replace').strip()
+
+    def _run_cli_with_file(self, cmd: list, wav_bytes: bytes) -> subprocess.CompletedProcess:
+        """Run whisper-cli on a temporary WAV file, kept in RAM where possible."""
+        # /dev/shm is memory-backed on Linux, so this still avoids the disk
+        tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        with tempfile.NamedTemporaryFile(suffix=".wav", dir=tmp_dir, delete=False) as tmp:
+            tmp.write(wav_bytes)
+            tmp_path = tmp.name
+
+        try:
+            return subprocess.run(
+                cmd + ["-f", tmp_path],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                timeout=30
+            )
         finally:
-            # Clean up temp file
             if os.path.exists(tmp_path):
                 os.remove(tmp_path)
 
+    def cleanup(self):
+        """Release transcription resources."""
+        self._stop_server()
+
 
 # =============================================================================
 # INTENT PARSER - Convert text to structured commands using Google Gemini
@@ -513,6 +992,373 @@ class WhisperTranscriber:
 # https://ai.google.dev/gemini-api/docs/models for current model names.
 # =============================================================================
 
+# Strips punctuation when normalizing commands for the response cache
+_PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+# Same, but keeps "." so decimal points survive ("warp 9.9" is not "warp 99")
+_PUNCTUATION_EXCEPT_DOT_TABLE = str.maketrans("", "", string.punctuation.replace(".", ""))
+# A "." that is not a decimal point (not between two digits)
+_RE_STRAY_DOT = re.compile(r'(?<!\d)\.|\.(?!\d)')
+
+# Trailing punctuation Whisper appends to a transcript ("Engage.", "Red alert!")
+_TRAILING_PUNCTUATION = ".,!?;:"
+
+# Valid destinations for navigation (spoken name -> canonical target)
+_VALID_TARGETS = {
+    "sun": "Sun", "the sun": "Sun", "sol": "Sun",
+    "mercury": "Mercury",
+    "venus": "Venus",
+    "earth": "Earth", "terra": "Earth", "home": "Earth",
+    "moon": "Moon", "the moon": "Moon", "luna": "Moon",
+    "mars": "Mars",
+    "jupiter": "Jupiter",
+    "saturn": "Saturn",
+    "uranus": "Uranus",
+    "neptune": "Neptune",
+    "pluto": "Pluto",
+    "starbase": "Starbase 1", "starbase 1": "Starbase 1", "starbase one": "Starbase 1",
+    "spacedock": "Starbase 1", "space dock": "Starbase 1",
+    "deep space nine": "Deep Space Nine", "deep space 9": "Deep Space Nine", "ds9": "Deep Space Nine",
+}
+
+# Single-word destinations, checked against the words of a bare warp command
+_TARGET_WORDS = frozenset(k for k in _VALID_TARGETS if " " not in k)
+# Multi-word destinations that no single word above already covers
+_TARGET_PHRASES = tuple(k for k in _VALID_TARGETS
+                        if " " in k and _TARGET_WORDS.isdisjoint(k.split()))
+# Words that turn "warp N" into a navigation command
+_NAV_WORDS = frozenset(["course", "head", "take", "set", "plot", "lay"])
+
+# Quick-match patterns, compiled once at import instead of on every command
+# "warp [number]", "warp factor [number]", "warp speed [number]"
+_RE_WARP = re.compile(r'warp\s*(?:factor\s*|speed\s*)?(\d+(?:\.\d+)?)')
+# Explicit speed changes, one pass for every phrasing (group 1 = warp):
+# "increase/raise/change/set/adjust [speed] to warp N",
+# "slow/reduce/decrease [speed] to warp N", "ahead warp [factor] N"
+_RE_WARP_CHANGE = re.compile(
+    r'(?:(?:increase|raise|change|set|adjust|slow|reduce|decrease)\s+(?:speed\s+)?to\s+warp\s*'
+    r'|ahead\s+warp\s*(?:factor\s*)?)(\d+(?:\.\d+)?)'
+)
+# "orbit X" / "enter orbit around X"
+_RE_ORBIT = re.compile(r'(?:orbit|enter orbit around|establish orbit around)\s+(\w+(?:\s+\w+)?)')
+# "scan X"
+_RE_SCAN = re.compile(r'scan\s+(.+)')
+# "evasive pattern X"
+_RE_EVASIVE = re.compile(r'evasive\s+(?:pattern\s+)?(\w+)')
+# "hail X"
+_RE_HAIL = re.compile(r'hail\s+(.+)')
+# "fire on X" / "target X"
+_RE_FIRE = re.compile(r'(?:fire|target|fire at|fire on)\s+(.+)')
+# "dock with X"
+_RE_DOCK = re.compile(r'dock\s+(?:with\s+)?(?:the\s+)?(.+)')
+# "land on X"
+_RE_LAND = re.compile(r'land\s+(?:on\s+)?(?:the\s+)?(.+)')
+
+# Navigation patterns, tried in order (group 1 = destination, group 2 = warp).
+# A two-word destination never ends in "warp", so "jupiter warp 5" keeps its warp.
+_NAV_PATTERNS = (
+    # "set course for X warp Y" / "plot a course to X"
+    re.compile(r"(?:set|plot|lay\s+in)\s+(?:a\s+)?course\s+(?:for|to)\s+(?:the\s+)?(\w+(?:\s+(?!warp\b)\w+)?)(?:.*warp\s*(?:factor\s*)?(\d+(?:\.\d+)?))?"),
+    # "course to X"
+    re.compile(r"course\s+(?:for|to)\s+(?:the\s+)?(\w+(?:\s+(?!warp\b)\w+)?)(?:.*warp\s*(?:factor\s*)?(\d+(?:\.\d+)?))?"),
+    # "take us to X" / "head to X" / "go to X" / "let's go to X"
+    re.compile(r"(?:take\s+us\s+to|head\s+(?:for|to)|go\s+to|let'?s\s+go\s+to)\s+(?:the\s+)?(\w+(?:\s+(?!warp\b)\w+)?)(?:.*warp\s*(?:factor\s*)?(\d+(?:\.\d+)?))?"),
+    # "X warp Y" (destination then warp)
+    re.compile(r"^(\w+(?:\s+\w+)?)\s+warp\s*(?:factor\s*)?(\d+(?:\.\d+)?)"),
+    # Just destination name if it's a valid target
+    re.compile(r"^(?:the\s+)?(\w+(?:\s+\w+)?)\s*$"),
+)
+
+# Commands recognized only when they are the whole utterance. Commands are
+# immutable, so one shared instance per phrase is safe to return.
+_EXACT_COMMANDS = {
+    # Star Trek catchphrases
+    **dict.fromkeys(["punch it", "hit it"], BridgeCommand("helm", "warp", None, 9.0, None, None)),
+    **dict.fromkeys(["engage", "make it so", "energize"], BridgeCommand("helm", "warp", None, 5.0, None, None)),
+    **dict.fromkeys(["maximum warp", "max warp"], BridgeCommand("helm", "warp", None, 9.9, None, None)),
+    **dict.fromkeys(["warp speed", "engage warp", "engage warp drive"], BridgeCommand("helm", "warp", None, 5.0, None, None)),
+    "faster": BridgeCommand("helm", "warp", None, 7.0, None, None),
+    # Impulse
+    **dict.fromkeys(["impulse", "impulse power", "impulse speed"], BridgeCommand("helm", "impulse", None, None, 50, None)),
+    # Stop / disengage / reverse
+    **dict.fromkeys(["all stop", "stop", "full stop", "halt", "hold position", "holding position",
+                     "drop out of warp", "exit warp", "come out of warp"],
+                    BridgeCommand("helm", "stop", None, None, None, None)),
+    **dict.fromkeys(["disengage", "cancel course", "abort", "disengage autopilot"],
+                    BridgeCommand("helm", "disengage", None, None, None, None)),
+    **dict.fromkeys(["reverse", "reverse engines", "back up", "back us off", "full reverse"],
+                    BridgeCommand("helm", "reverse", None, None, None, None)),
+    # Alerts / status
+    "stand down": BridgeCommand("tactical", "green_alert", None, None, None, None),
+    **dict.fromkeys(["status", "status report", "report", "ship status"], BridgeCommand("ops", "status", None, None, None, None)),
+    # Orbit / evasive / hail (without a target)
+    **dict.fromkeys(["standard orbit", "enter orbit", "establish orbit", "orbit"], BridgeCommand("helm", "orbit", None, None, None, None)),
+    **dict.fromkeys(["evasive maneuvers", "evasive"], BridgeCommand("helm", "evasive", None, None, None, None)),
+    **dict.fromkeys(["hail them", "open a channel", "on screen", "open channel"], BridgeCommand("ops", "hail", None, None, None, None)),
+}
+
+# Commands recognized anywhere in the utterance, checked in order (first
+# rule with a matching phrase wins). Order matters where phrases overlap.
+_PHRASE_COMMANDS = (
+    # Impulse
+    (("full impulse", "ahead full"), BridgeCommand("helm", "impulse", None, None, 100, None)),
+    (("half impulse",), BridgeCommand("helm", "impulse", None, None, 50, None)),
+    (("quarter impulse", "one quarter impulse"), BridgeCommand("helm", "impulse", None, None, 25, None)),
+    (("three quarter impulse",), BridgeCommand("helm", "impulse", None, None, 75, None)),
+    (("ahead one third", "one third impulse"), BridgeCommand("helm", "impulse", None, None, 33, None)),
+    (("ahead two thirds", "two thirds impulse"), BridgeCommand("helm", "impulse", None, None, 66, None)),
+    (("thrusters only", "thrusters"), BridgeCommand("helm", "impulse", None, None, 10, None)),
+    # Stop / disengage
+    (("drop out of warp", "exit warp"), BridgeCommand("helm", "stop", None, None, None, None)),
+    (("disengage",), BridgeCommand("helm", "disengage", None, None, None, None)),
+    # Shields (Whisper often drops the plural: "raise shield", "shield up")
+    (("raise shield", "shields up", "shield up"), BridgeCommand("tactical", "raise_shields", None, None, None, None)),
+    (("lower shield", "shields down", "shield down"), BridgeCommand("tactical", "lower_shields", None, None, None, None)),
+    # Alerts
+    (("red alert", "battle stations"), BridgeCommand("tactical", "red_alert", None, None, None, None)),
+    (("yellow alert",), BridgeCommand("tactical", "yellow_alert", None, None, None, None)),
+    (("green alert",), BridgeCommand("tactical", "green_alert", None, None, None, None)),
+    # Reports
+    (("damage report",), BridgeCommand("engineering", "damage_report", None, None, None, None)),
+)
+
+# Fixed results of the remaining quick-match rules, shared like the tables above
+_CMD_FIRE_AT_ENEMY = BridgeCommand("tactical", "fire", "enemy", None, None, None)
+_CMD_DOCK_AT_STARBASE = BridgeCommand("helm", "dock", "Starbase 1", None, None, None)
+_CMD_GO_HOME = BridgeCommand("helm", "navigate", "Earth", 5.0, None, None)
+
+# Decodes the command object out of a Gemini response
+_JSON_DECODER = json.JSONDecoder()
+
+# Normalize intent (LLM sometimes returns variations)
+_INTENT_MAP = {
+    # Navigation variations
+    'navigation': 'navigate',
+    'set_course': 'navigate',
+    'course': 'navigate',
+    'go_to': 'navigate',
+    'goto': 'navigate',
+    'head_to': 'navigate',
+    'take_us_to': 'navigate',
+    'plot_course': 'navigate',
+    'lay_in_course': 'navigate',
+    # Warp variations
+    'engage': 'warp',
+    'engage_warp': 'warp',
+    'warp_speed': 'warp',
+    'increase_speed': 'warp',
+    'change_speed': 'warp',
+    # Stop variations
+    'full_stop': 'stop',
+    'all_stop': 'stop',
+    'halt': 'stop',
+    'hold': 'stop',
+    'hold_position': 'stop',
+    'drop_out': 'stop',
+    'exit_warp': 'stop',
+    # Shield variations
+    'shields_up': 'raise_shields',
+    'shields_down': 'lower_shields',
+    # Orbit variations
+    'enter_orbit': 'orbit',
+    'standard_orbit': 'orbit',
+    'establish_orbit': 'orbit',
+    # Status variations
+    'report': 'status',
+    'ship_status': 'status',
+    'status_report': 'status',
+    # Alert variations
+    'battlestations': 'red_alert',
+    'battle_stations': 'red_alert',
+    'condition_red': 'red_alert',
+    'condition_yellow': 'yellow_alert',
+    'condition_green': 'green_alert',
+    'stand_down': 'green_alert',
+    # Evasive variations
+    'evasive_maneuvers': 'evasive',
+    'evasive_action': 'evasive',
+    # Hail variations
+    'open_channel': 'hail',
+    'hail_ship': 'hail',
+    'on_screen': 'viewscreen',
+    'onscreen': 'viewscreen',
+    # Fire variations
+    'attack': 'fire',
+    'fire_weapons': 'fire',
+    'fire_phasers': 'fire',
+    'fire_torpedoes': 'fire',
+}
+
+
+# Words that flip a command's meaning while barely changing its spelling;
+# a semantic cache hit must agree on all of them
+_SEMANTIC_ANCHOR_WORDS = frozenset([
+    "raise", "lower", "up", "down", "increase", "decrease", "slow", "reduce",
+    "full", "half", "quarter", "third", "thirds", "red", "yellow", "green",
+    "stop", "reverse", "disengage", "fire", "dock", "land", "orbit", "scan", "hail",
+])
+_RE_NUMBER = re.compile(r'\d+(?:\.\d+)?')
+
+
+class SemanticCache:
+    """
+    Reuses previous Gemini interpretations for slightly different phrasings
+    of the same command ("take us to mars please" / "take us to mars").
+
+    Phrases are embedded as hashed character-trigram vectors (no model to
+    load) and compared by cosine similarity with one matrix-vector product.
+    A hit also requires the same numbers, destinations and anchor words,
+    and the same memory state, so "warp 5" never answers "warp 7".
+    """
+
+    DIM = 1024  # Embedding size (trigram hash buckets)
+
+    def __init__(self, max_size: int, threshold: float):
+        self.max_size = max_size
+        self.threshold = threshold
+        self._vectors = np.zeros((max_size, self.DIM), dtype=np.float32)
+        self._entries: list = [None] * max_size  # (anchors, context signature, command)
+        self._last_used = np.zeros(max_size, dtype=np.int64)
+        self._count = 0
+        self._clock = 0
+
+    def _embed(self, text: str) -> np.ndarray:
+        """Unit-length hashed character-trigram vector for a normalized phrase."""
+        padded = f" {text} "
+        buckets = [hash(padded[i:i + 3]) % self.DIM for i in range(len(padded) - 2)]
+        vector = np.bincount(buckets, minlength=self.DIM).astype(np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _anchors(self, text: str, raw: str) -> tuple:
+        """
+        Parts of a phrase that must match exactly for a hit. Numbers come
+        from the raw transcript, so normalization can never merge two.
+        """
+        words = text.split()
+        return (
+            tuple(_RE_NUMBER.findall(raw)),
+            tuple(sorted(name for name in _VALID_TARGETS if name in text)),
+            tuple(sorted(_SEMANTIC_ANCHOR_WORDS.intersection(words))),
+        )
+
+    def lookup(self, text: str, raw: str, context: tuple) -> Optional[BridgeCommand]:
+        """
+        Find the cached command for the most similar phrase.
+
+        Args:
+            text: Normalized command text
+            raw: The transcript as heard (numbers are checked against it)
+            context: Memory signature the command was interpreted in
+
+        Returns:
+            The cached BridgeCommand, or None if nothing is similar enough
+        """
+        if not self._count:
+            return None
+
+        scores = self._vectors[:self._count] @ self._embed(text)
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+
+        anchors, cached_context, command = self._entries[best]
+        if anchors != self._anchors(text, raw) or cached_context != context:
+            return None
+
+        self._clock += 1
+        self._last_used[best] = self._clock
+        return command
+
+    def insert(self, text: str, raw: str, context: tuple, command: BridgeCommand):
+        """Remember a command, evicting the least recently used phrase when full."""
+        if self._count < self.max_size:
+            slot = self._count
+            self._count += 1
+        else:
+            slot = int(np.argmin(self._last_used))
+
+        self._clock += 1
+        self._vectors[slot] = self._embed(text)
+        self._entries[slot] = (self._anchors(text, raw), context, command)
+        self._last_used[slot] = self._clock
+
+
+class ResponseStore:
+    """
+    Gemini interpretations saved to SQLite, so commands seen in earlier
+    sessions skip the API from the first command of a new one.
+
+    Entries are keyed on a hash of the normalized text and memory signature,
+    salted with the model name and system prompt - changing either simply
+    starts a fresh set of entries.
+    """
+
+    # Bump when the key changes meaning (e.g. how text is normalized); entries
+    # saved under an older version are deleted when the store is opened
+    KEY_VERSION = 2  # 2: decimal points kept by IntentParser._normalize
+
+    def __init__(self, path: str, namespace: str, max_age_days: float):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._salt = hashlib.blake2b(f"{self.KEY_VERSION}\0{namespace}".encode("utf-8"),
+                                     digest_size=16).digest()
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key BLOB PRIMARY KEY, command TEXT NOT NULL, last_used REAL NOT NULL)"
+        )
+        if self._db.execute("PRAGMA user_version").fetchone()[0] != self.KEY_VERSION:
+            self._db.execute("DELETE FROM responses")
+            self._db.execute(f"PRAGMA user_version = {self.KEY_VERSION}")
+        self._db.execute("DELETE FROM responses WHERE last_used < ?",
+                         (time.time() - max_age_days * 86400,))
+
+    def _key(self, text: str, context: tuple) -> bytes:
+        """128-bit key for a phrase in a given memory state."""
+        return hashlib.blake2b(repr((text, context)).encode("utf-8"),
+                               digest_size=16, key=self._salt).digest()
+
+    def lookup(self, text: str, context: tuple) -> Optional[BridgeCommand]:
+        """
+        Find a saved interpretation.
+
+        Args:
+            text: Normalized command text
+            context: Memory signature the command was interpreted in
+
+        Returns:
+            The saved BridgeCommand, or None if there is none
+        """
+        key = self._key(text, context)
+        try:
+            with self._lock:
+                row = self._db.execute("SELECT command FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                self._db.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+            return BridgeCommand(**json.loads(row[0]))
+        except (sqlite3.Error, ValueError, TypeError) as e:
+            print(f"[CACHE] Could not read saved interpretation: {e}")
+            return None
+
+    def insert(self, text: str, context: tuple, command: BridgeCommand):
+        """Save an interpretation (replacing any older one for the same key)."""
+        try:
+            with self._lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, command, last_used) VALUES (?, ?, ?)",
+                    (self._key(text, context), command.to_json(), time.time()),
+                )
+        except sqlite3.Error as e:
+            print(f"[CACHE] Could not save interpretation: {e}")
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            self._db.close()
+
+
 class IntentParser:
     """
     Parses natural language commands into structured JSON using Google Gemini.
@@ -525,15 +1371,44 @@ class IntentParser:
         self.memory = memory
         self.model_name = Config.GEMINI_MODEL
 
+        # Recent Gemini results keyed by (normalized text, memory signature)
+        self._response_cache: "OrderedDict[tuple, BridgeCommand]" = OrderedDict()
+        self._semantic_cache: Optional[SemanticCache] = None
+        # Guards the caches, which prefetches of partial transcripts also use
+        self._cache_lock = threading.Lock()
+        self._inflight: Dict[tuple, threading.Event] = {}  # Prefetches still waiting on Gemini
+        if Config.SEMANTIC_CACHE_ENABLED:
+            self._semantic_cache = SemanticCache(Config.SEMANTIC_CACHE_SIZE, Config.SEMANTIC_CACHE_THRESHOLD)
+
         # Try to import google-generativeai
         try:
             import google.generativeai as genai
+            from google.api_core import exceptions as api_exceptions  # Installed with it
             self.genai = genai
+            self._api_exceptions = api_exceptions
         except ImportError:
             print("ERROR: google-generativeai not installed.")
             print("  Install with: pip3 install google-generativeai")
             sys.exit(1)
 
+        # The system prompt is static, so build it once and send it as the
+        # model's system instruction - an identical prefix on every request
+        # lets Gemini reuse it instead of re-processing it per command
+        self._system_prompt = self._build_system_prompt()
+        self._response_schema: Optional[dict] = _RESPONSE_SCHEMA  # Cleared if the API rejects it
+
+        # Interpretations from earlier sessions (tied to this model and prompt)
+        self._response_store: Optional[ResponseStore] = None
+        if Config.RESPONSE_CACHE_ENABLED and Config.RESPONSE_CACHE_PATH:
+            try:
+                self._response_store = ResponseStore(
+                    Config.RESPONSE_CACHE_PATH,
+                    f"{self.model_name}\0{self._system_prompt}",
+                    Config.RESPONSE_CACHE_MAX_AGE_DAYS,
+                )
+            except (sqlite3.Error, OSError) as e:
+                print(f"[CACHE] Saved interpretations unavailable: {e}")
+
         # Initialize Gemini
         self._init_gemini()
 
@@ -548,304 +1423,145 @@ class IntentParser:
 
         try:
             self.genai.configure(api_key=api_key)
-            self.model = self.genai.GenerativeModel(self.model_name)
+            self.model = self._create_model()
             print(f"[GEMINI] Connected, using model: {self.model_name}")
         except Exception as e:
             print(f"ERROR: Cannot initialize Gemini: {e}")
             sys.exit(1)
 
+        if Config.GEMINI_WARMUP:
+            self._warmup()
+
+    def _create_model(self):
+        """
+        Create the Gemini model with the system prompt as its fixed prefix.
+
+        Server-side context caching is not used: the compact prompt is well
+        below the API's minimum cacheable size, so creating one always fails.
+        """
+        return self.genai.GenerativeModel(
+            self.model_name,
+            system_instruction=self._system_prompt,
+        )
+
+    def cleanup(self):
+        """Close the saved-interpretation store."""
+        if self._response_store:
+            self._response_store.close()
+            self._response_store = None
+
+    def _warmup(self):
+        """
+        Make a tiny request so the first voice command doesn't pay for
+        channel setup, TLS and auth.
+        """
+        try:
+            self.model.generate_content(
+                "ok",
+                generation_config=self.genai.types.GenerationConfig(max_output_tokens=1)
+            )
+            print("[GEMINI] Warmed up")
+        except Exception as e:
+            print(f"[GEMINI] Warmup failed (continuing): {e}")
+
     def _build_system_prompt(self) -> str:
-        """Comprehensive prompt for Star Trek command parsing."""
+        """
+        Compact prompt for Star Trek command parsing.
+
+        Common phrasings never reach Gemini (see _try_pattern_match), so only
+        the intent list and a few edge cases are included. The output shape
+        is enforced separately by _RESPONSE_SCHEMA.
+        """
         return """You are a Star Trek starship computer parsing voice commands into JSON.
 
 Output ONLY valid JSON in this format:
 {"department":"helm","intent":"navigate","target":"Jupiter","warp_factor":5,"impulse_percent":null,"maneuver":null,"confidence":0.9}
 
-VALID INTENTS:
-- navigate: Set course to a destination (requires target, optional warp_factor)
-- warp: Change warp speed only (requires warp_factor, no target)
-- impulse: Set impulse speed (requires impulse_percent: 0-100)
-- stop: All stop / full stop / drop out of warp
-- disengage: Disengage autopilot or current course
-- orbit: Enter orbit around target (requires target)
-- raise_shields: Raise shields / shields up
-- lower_shields: Lower shields / shields down
-- red_alert: Red alert
-- yellow_alert: Yellow alert
-- green_alert: Green alert / stand down
-- scan: Scan a target (requires target)
-- status: Ship status report
-- damage_report: Damage report
-- hail: Hail a target (requires target)
-- fire: Fire weapons at target (requires target)
-- evasive: Evasive maneuvers (optional maneuver name)
-- reverse: Reverse course/engines
-- dock: Dock with station/target
-- land: Land on planet/target
-
-VALID TARGETS (planets/locations):
-Sun, Mercury, Venus, Earth, Moon, Mars, Jupiter, Saturn, Uranus, Neptune, Pluto, Starbase 1, Starbase, Deep Space Nine, DS9
-
-NAVIGATION EXAMPLES:
+Use null for fields that don't apply. warp_factor is 1-9.99 (5 if a course is set without one), impulse_percent is 0-100, confidence is 0.0-1.0 for how well you understood the command.
+
+INTENTS (department):
+- navigate (helm): set course to a destination; needs target and warp_factor
+- warp (helm): change warp speed only; needs warp_factor, no target
+- impulse (helm): needs impulse_percent (full 100, half 50, quarter 25, thrusters 10)
+- stop (helm): all stop / drop out of warp
+- disengage (helm): cancel autopilot or the current course
+- orbit (helm): enter orbit, optional target
+- reverse, evasive (optional maneuver name), dock, land (helm): dock/land take a target
+- raise_shields, lower_shields, red_alert, yellow_alert, green_alert (tactical)
+- fire (tactical): needs target ("enemy" if none is named)
+- status, scan (needs target), hail, viewscreen (ops)
+- damage_report (engineering)
+
+TARGETS: Sun, Mercury, Venus, Earth (home), Moon, Mars, Jupiter, Saturn, Uranus, Neptune, Pluto, Starbase 1 (starbase, the station), Deep Space Nine
+
+EXAMPLES:
 "set course for jupiter warp 5" → {"department":"helm","intent":"navigate","target":"Jupiter","warp_factor":5}
-"take us to mars" → {"department":"helm","intent":"navigate","target":"Mars","warp_factor":5}
-"head to earth" → {"department":"helm","intent":"navigate","target":"Earth","warp_factor":5}
-"plot a course to saturn" → {"department":"helm","intent":"navigate","target":"Saturn","warp_factor":5}
-"lay in a course for neptune warp 8" → {"department":"helm","intent":"navigate","target":"Neptune","warp_factor":8}
-"let's go to jupiter" → {"department":"helm","intent":"navigate","target":"Jupiter","warp_factor":5}
-"let's go home" → {"department":"helm","intent":"navigate","target":"Earth","warp_factor":5}
-"take me home" → {"department":"helm","intent":"navigate","target":"Earth","warp_factor":5}
-"back to earth" → {"department":"helm","intent":"navigate","target":"Earth","warp_factor":5}
-
-WARP SPEED EXAMPLES (changing speed without destination):
-"warp 9" → {"department":"helm","intent":"warp","warp_factor":9}
-"warp factor 7" → {"department":"helm","intent":"warp","warp_factor":7}
-"increase speed to warp 9" → {"department":"helm","intent":"warp","warp_factor":9}
-"increase to warp 8" → {"department":"helm","intent":"warp","warp_factor":8}
-"speed up to warp 6" → {"department":"helm","intent":"warp","warp_factor":6}
-"faster" → {"department":"helm","intent":"warp","warp_factor":7}
-"maximum warp" → {"department":"helm","intent":"warp","warp_factor":9.9}
-"warp speed" → {"department":"helm","intent":"warp","warp_factor":5}
-"engage warp drive" → {"department":"helm","intent":"warp","warp_factor":5}
-"punch it" → {"department":"helm","intent":"warp","warp_factor":9}
-"hit it" → {"department":"helm","intent":"warp","warp_factor":9}
-"engage" → {"department":"helm","intent":"warp","warp_factor":5}
-"make it so" → {"department":"helm","intent":"warp","warp_factor":5}
-"energize" → {"department":"helm","intent":"warp","warp_factor":5}
-"ahead warp factor 5" → {"department":"helm","intent":"warp","warp_factor":5}
-"slow to warp 2" → {"department":"helm","intent":"warp","warp_factor":2}
-"reduce speed to warp 3" → {"department":"helm","intent":"warp","warp_factor":3}
-
-IMPULSE EXAMPLES:
-"full impulse" → {"department":"helm","intent":"impulse","impulse_percent":100}
-"half impulse" → {"department":"helm","intent":"impulse","impulse_percent":50}
-"quarter impulse" → {"department":"helm","intent":"impulse","impulse_percent":25}
-"one quarter impulse" → {"department":"helm","intent":"impulse","impulse_percent":25}
-"three quarter impulse" → {"department":"helm","intent":"impulse","impulse_percent":75}
-"impulse power" → {"department":"helm","intent":"impulse","impulse_percent":50}
-"ahead one third" → {"department":"helm","intent":"impulse","impulse_percent":33}
-"ahead two thirds" → {"department":"helm","intent":"impulse","impulse_percent":66}
-"ahead full" → {"department":"helm","intent":"impulse","impulse_percent":100}
-"thrusters only" → {"department":"helm","intent":"impulse","impulse_percent":10}
-
-STOP/DISENGAGE EXAMPLES:
-"all stop" → {"department":"helm","intent":"stop"}
-"full stop" → {"department":"helm","intent":"stop"}
-"stop" → {"department":"helm","intent":"stop"}
-"hold position" → {"department":"helm","intent":"stop"}
-"drop out of warp" → {"department":"helm","intent":"stop"}
-"exit warp" → {"department":"helm","intent":"stop"}
-"disengage" → {"department":"helm","intent":"disengage"}
-"disengage autopilot" → {"department":"helm","intent":"disengage"}
-"cancel course" → {"department":"helm","intent":"disengage"}
-"abort" → {"department":"helm","intent":"disengage"}
-
-ORBIT EXAMPLES:
-"orbit earth" → {"department":"helm","intent":"orbit","target":"Earth"}
-"standard orbit" → {"department":"helm","intent":"orbit"}
-"enter orbit" → {"department":"helm","intent":"orbit"}
-"establish orbit around mars" → {"department":"helm","intent":"orbit","target":"Mars"}
 "geosynchronous orbit" → {"department":"helm","intent":"orbit"}
-
-TACTICAL EXAMPLES:
-"raise shields" → {"department":"tactical","intent":"raise_shields"}
-"shields up" → {"department":"tactical","intent":"raise_shields"}
-"lower shields" → {"department":"tactical","intent":"lower_shields"}
-"shields down" → {"department":"tactical","intent":"lower_shields"}
-"red alert" → {"department":"tactical","intent":"red_alert"}
-"yellow alert" → {"department":"tactical","intent":"yellow_alert"}
-"green alert" → {"department":"tactical","intent":"green_alert"}
-"stand down" → {"department":"tactical","intent":"green_alert"}
-"battle stations" → {"department":"tactical","intent":"red_alert"}
-"fire phasers" → {"department":"tactical","intent":"fire","target":"enemy"}
-"fire torpedoes" → {"department":"tactical","intent":"fire","target":"enemy"}
+"a little faster" → {"department":"helm","intent":"warp","warp_factor":7}
 "target that ship" → {"department":"tactical","intent":"fire","target":"enemy"}
-"evasive maneuvers" → {"department":"helm","intent":"evasive"}
-"evasive pattern alpha" → {"department":"helm","intent":"evasive","maneuver":"alpha"}
-"evasive pattern delta" → {"department":"helm","intent":"evasive","maneuver":"delta"}
-
-OPS/ENGINEERING EXAMPLES:
-"status" → {"department":"ops","intent":"status"}
-"status report" → {"department":"ops","intent":"status"}
-"ship status" → {"department":"ops","intent":"status"}
-"report" → {"department":"ops","intent":"status"}
-"damage report" → {"department":"engineering","intent":"damage_report"}
-"scan jupiter" → {"department":"ops","intent":"scan","target":"Jupiter"}
 "scan for life signs" → {"department":"ops","intent":"scan","target":"life signs"}
-"hail them" → {"department":"ops","intent":"hail","target":"them"}
-"hail starbase" → {"department":"ops","intent":"hail","target":"Starbase 1"}
-"open a channel" → {"department":"ops","intent":"hail"}
 "on screen" → {"department":"ops","intent":"viewscreen"}
 
-MISC EXAMPLES:
-"reverse" → {"department":"helm","intent":"reverse"}
-"reverse engines" → {"department":"helm","intent":"reverse"}
-"back us off" → {"department":"helm","intent":"reverse"}
-"dock with the station" → {"department":"helm","intent":"dock","target":"Starbase 1"}
-"land on mars" → {"department":"helm","intent":"land","target":"Mars"}
-
-ALWAYS output valid JSON. No explanation text. confidence should be 0.0-1.0 based on how well you understood the command."""
+If no Context line is given there is no previous context."""
 
     def _try_pattern_match(self, text: str) -> Optional[BridgeCommand]:
         """Try to match common commands without using the LLM (faster)."""
-        import re
-        text_lower = text.lower().strip().rstrip('.').rstrip(',').rstrip('!')
-
-        # Valid destinations for navigation
-        valid_targets = {
-            "sun": "Sun", "the sun": "Sun", "sol": "Sun",
-            "mercury": "Mercury",
-            "venus": "Venus",
-            "earth": "Earth", "terra": "Earth", "home": "Earth",
-            "moon": "Moon", "the moon": "Moon", "luna": "Moon",
-            "mars": "Mars",
-            "jupiter": "Jupiter",
-            "saturn": "Saturn",
-            "uranus": "Uranus",
-            "neptune": "Neptune",
-            "pluto": "Pluto",
-            "starbase": "Starbase 1", "starbase 1": "Starbase 1", "starbase one": "Starbase 1",
-            "spacedock": "Starbase 1", "space dock": "Starbase 1",
-            "deep space nine": "Deep Space Nine", "deep space 9": "Deep Space Nine", "ds9": "Deep Space Nine",
-        }
+        text_lower = text.lower().strip().rstrip(_TRAILING_PUNCTUATION)
+
+        # Whole-phrase commands: one dict lookup instead of a list scan per rule
+        exact = _EXACT_COMMANDS.get(text_lower)
+        if exact:
+            return exact
 
         # =====================================================================
         # WARP SPEED COMMANDS (no destination, just speed change)
         # =====================================================================
 
         # "warp [number]", "warp factor [number]", "warp speed [number]"
-        warp_match = re.search(r'warp\s*(?:factor\s*|speed\s*)?(\d+(?:\.\d+)?)', text_lower)
-
-        # "increase/raise/change speed to warp [number]"
-        increase_warp = re.search(r'(?:increase|raise|change|set|adjust)\s+(?:speed\s+)?to\s+warp\s*(\d+(?:\.\d+)?)', text_lower)
-        if increase_warp:
-            return BridgeCommand("helm", "warp", None, float(increase_warp.group(1)), None, None)
-
-        # "increase to warp [number]"
-        increase_warp2 = re.search(r'increase\s+to\s+warp\s*(\d+(?:\.\d+)?)', text_lower)
-        if increase_warp2:
-            return BridgeCommand("helm", "warp", None, float(increase_warp2.group(1)), None, None)
-
-        # "slow/reduce to warp [number]"
-        slow_warp = re.search(r'(?:slow|reduce|decrease)\s+(?:speed\s+)?to\s+warp\s*(\d+(?:\.\d+)?)', text_lower)
-        if slow_warp:
-            return BridgeCommand("helm", "warp", None, float(slow_warp.group(1)), None, None)
-
-        # "ahead warp factor [number]"
-        ahead_warp = re.search(r'ahead\s+warp\s*(?:factor\s*)?(\d+(?:\.\d+)?)', text_lower)
-        if ahead_warp:
-            return BridgeCommand("helm", "warp", None, float(ahead_warp.group(1)), None, None)
-
-        # Star Trek catchphrases
-        if text_lower in ["punch it", "hit it"]:
-            return BridgeCommand("helm", "warp", None, 9.0, None, None)
-        if text_lower in ["engage", "make it so", "energize"]:
-            return BridgeCommand("helm", "warp", None, 5.0, None, None)
-        if text_lower in ["maximum warp", "max warp"]:
-            return BridgeCommand("helm", "warp", None, 9.9, None, None)
-        if text_lower in ["warp speed", "engage warp", "engage warp drive"]:
-            return BridgeCommand("helm", "warp", None, 5.0, None, None)
-        if text_lower == "faster":
-            return BridgeCommand("helm", "warp", None, 7.0, None, None)
+        warp_match = _RE_WARP.search(text_lower)
+
+        # "increase speed to warp 7", "slow to warp 2", "ahead warp factor 5"
+        warp_change = _RE_WARP_CHANGE.search(text_lower)
+        if warp_change:
+            return BridgeCommand("helm", "warp", None, float(warp_change.group(1)), None, None)
 
         # Simple "warp [number]" without destination context
-        if warp_match and not any(t in text_lower for t in valid_targets.keys()):
-            # Make sure this isn't a navigation command
-            nav_words = ["course", "head", "take", "go to", "set", "plot", "lay"]
-            if not any(w in text_lower for w in nav_words):
+        if warp_match:
+            # Make sure this isn't a navigation command (no destination, no nav word)
+            words = text_lower.translate(_PUNCTUATION_TABLE).split()
+            if (_TARGET_WORDS.isdisjoint(words) and _NAV_WORDS.isdisjoint(words)
+                    and not any(p in text_lower for p in _TARGET_PHRASES)
+                    and "go to" not in text_lower):
                 return BridgeCommand("helm", "warp", None, float(warp_match.group(1)), None, None)
 
-        # =====================================================================
-        # IMPULSE COMMANDS
-        # =====================================================================
-        if "full impulse" in text_lower or "ahead full" in text_lower:
-            return BridgeCommand("helm", "impulse", None, None, 100, None)
-        if "half impulse" in text_lower:
-            return BridgeCommand("helm", "impulse", None, None, 50, None)
-        if "quarter impulse" in text_lower or "one quarter impulse" in text_lower:
-            return BridgeCommand("helm", "impulse", None, None, 25, None)
-        if "three quarter impulse" in text_lower:
-            return BridgeCommand("helm", "impulse", None, None, 75, None)
-        if "ahead one third" in text_lower or "one third impulse" in text_lower:
-            return BridgeCommand("helm", "impulse", None, None, 33, None)
-        if "ahead two thirds" in text_lower or "two thirds impulse" in text_lower:
-            return BridgeCommand("helm", "impulse", None, None, 66, None)
-        if text_lower in ["impulse", "impulse power", "impulse speed"]:
-            return BridgeCommand("helm", "impulse", None, None, 50, None)
-        if "thrusters only" in text_lower or "thrusters" in text_lower:
-            return BridgeCommand("helm", "impulse", None, None, 10, None)
-
-        # =====================================================================
-        # STOP / DISENGAGE COMMANDS
-        # =====================================================================
-        stop_phrases = ["all stop", "stop", "full stop", "hold position", "holding position",
-                        "drop out of warp", "exit warp", "come out of warp"]
-        if text_lower in stop_phrases or any(p in text_lower for p in ["drop out of warp", "exit warp"]):
-            return BridgeCommand("helm", "stop", None, None, None, None)
-
-        disengage_phrases = ["disengage", "cancel course", "abort", "disengage autopilot"]
-        if text_lower in disengage_phrases or "disengage" in text_lower:
-            return BridgeCommand("helm", "disengage", None, None, None, None)
-
-        # =====================================================================
-        # REVERSE COMMANDS
-        # =====================================================================
-        if text_lower in ["reverse", "reverse engines", "back up", "back us off", "full reverse"]:
-            return BridgeCommand("helm", "reverse", None, None, None, None)
-
-        # =====================================================================
-        # SHIELD COMMANDS
-        # =====================================================================
-        if "raise shields" in text_lower or "shields up" in text_lower:
-            return BridgeCommand("tactical", "raise_shields", None, None, None, None)
-        if "lower shields" in text_lower or "shields down" in text_lower:
-            return BridgeCommand("tactical", "lower_shields", None, None, None, None)
-
-        # =====================================================================
-        # ALERT COMMANDS
-        # =====================================================================
-        if "red alert" in text_lower or "battle stations" in text_lower:
-            return BridgeCommand("tactical", "red_alert", None, None, None, None)
-        if "yellow alert" in text_lower:
-            return BridgeCommand("tactical", "yellow_alert", None, None, None, None)
-        if "green alert" in text_lower or text_lower == "stand down":
-            return BridgeCommand("tactical", "green_alert", None, None, None, None)
-
-        # =====================================================================
-        # STATUS / REPORT COMMANDS
-        # =====================================================================
-        if text_lower in ["status", "status report", "report", "ship status"]:
-            return BridgeCommand("ops", "status", None, None, None, None)
-        if "damage report" in text_lower:
-            return BridgeCommand("engineering", "damage_report", None, None, None, None)
+        # Impulse, stop, shields, alerts, damage report: see _PHRASE_COMMANDS
+        for phrases, command in _PHRASE_COMMANDS:
+            for phrase in phrases:
+                if phrase in text_lower:
+                    return command
 
         # =====================================================================
         # ORBIT COMMANDS
         # =====================================================================
-        if text_lower in ["standard orbit", "enter orbit", "establish orbit", "orbit"]:
-            return BridgeCommand("helm", "orbit", None, None, None, None)
-
-        orbit_match = re.search(r'(?:orbit|enter orbit around|establish orbit around)\s+(\w+(?:\s+\w+)?)', text_lower)
+        orbit_match = _RE_ORBIT.search(text_lower)
         if orbit_match:
             target_text = orbit_match.group(1).lower()
-            target = valid_targets.get(target_text, target_text.capitalize())
+            target = _VALID_TARGETS.get(target_text, target_text.capitalize())
             return BridgeCommand("helm", "orbit", target, None, None, None)
 
         # =====================================================================
         # SCAN COMMANDS
         # =====================================================================
-        scan_match = re.search(r'scan\s+(.+)', text_lower)
+        scan_match = _RE_SCAN.search(text_lower)
         if scan_match:
             target_text = scan_match.group(1).strip()
-            target = valid_targets.get(target_text, target_text.capitalize())
+            target = _VALID_TARGETS.get(target_text, target_text.capitalize())
             return BridgeCommand("ops", "scan", target, None, None, None)
 
         # =====================================================================
         # EVASIVE MANEUVERS
         # =====================================================================
-        if text_lower == "evasive maneuvers" or text_lower == "evasive":
-            return BridgeCommand("helm", "evasive", None, None, None, None)
-        evasive_match = re.search(r'evasive\s+(?:pattern\s+)?(\w+)', text_lower)
+        evasive_match = _RE_EVASIVE.search(text_lower)
         if evasive_match:
             maneuver = evasive_match.group(1)
             return BridgeCommand("helm", "evasive", None, None, None, maneuver)
@@ -853,20 +1569,18 @@ ALWAYS output valid JSON. No explanation text. confidence should be 0.0-1.0 base
         # =====================================================================
         # HAIL COMMANDS
         # =====================================================================
-        if text_lower in ["hail them", "open a channel", "on screen", "open channel"]:
-            return BridgeCommand("ops", "hail", None, None, None, None)
-        hail_match = re.search(r'hail\s+(.+)', text_lower)
+        hail_match = _RE_HAIL.search(text_lower)
         if hail_match:
             target_text = hail_match.group(1).strip()
-            target = valid_targets.get(target_text, target_text.capitalize())
+            target = _VALID_TARGETS.get(target_text, target_text.capitalize())
             return BridgeCommand("ops", "hail", target, None, None, None)
 
         # =====================================================================
         # FIRE COMMANDS
         # =====================================================================
         if "fire phasers" in text_lower or "fire torpedoes" in text_lower or "open fire" in text_lower:
-            return BridgeCommand("tactical", "fire", "enemy", None, None, None)
-        fire_match = re.search(r'(?:fire|target|fire at|fire on)\s+(.+)', text_lower)
+            return _CMD_FIRE_AT_ENEMY
+        fire_match = _RE_FIRE.search(text_lower)
         if fire_match:
             target = fire_match.group(1).strip().capitalize()
             return BridgeCommand("tactical", "fire", target, None, None, None)
@@ -875,17 +1589,17 @@ ALWAYS output valid JSON. No explanation text. confidence should be 0.0-1.0 base
         # DOCK / LAND COMMANDS
         # =====================================================================
         if "dock" in text_lower:
-            dock_match = re.search(r'dock\s+(?:with\s+)?(?:the\s+)?(.+)', text_lower)
+            dock_match = _RE_DOCK.search(text_lower)
             if dock_match:
                 target_text = dock_match.group(1).strip().lower()
-                target = valid_targets.get(target_text, target_text.capitalize())
+                target = _VALID_TARGETS.get(target_text, target_text.capitalize())
                 return BridgeCommand("helm", "dock", target, None, None, None)
-            return BridgeCommand("helm", "dock", "Starbase 1", None, None, None)
+            return _CMD_DOCK_AT_STARBASE
 
-        land_match = re.search(r'land\s+(?:on\s+)?(?:the\s+)?(.+)', text_lower)
+        land_match = _RE_LAND.search(text_lower)
         if land_match:
             target_text = land_match.group(1).strip().lower()
-            target = valid_targets.get(target_text, target_text.capitalize())
+            target = _VALID_TARGETS.get(target_text, target_text.capitalize())
             return BridgeCommand("helm", "land", target, None, None, None)
 
         # =====================================================================
@@ -894,31 +1608,19 @@ ALWAYS output valid JSON. No explanation text. confidence should be 0.0-1.0 base
 
         # "let's go home" / "take me home" / "back to earth"
         if "go home" in text_lower or "take me home" in text_lower or "back to earth" in text_lower:
-            return BridgeCommand("helm", "navigate", "Earth", 5.0, None, None)
+            return _CMD_GO_HOME
 
-        # Complex navigation patterns
-        nav_patterns = [
-            # "set course for X warp Y" / "plot a course to X"
-            r"(?:set|plot|lay\s+in)\s+(?:a\s+)?course\s+(?:for|to)\s+(?:the\s+)?(\w+(?:\s+\w+)?)(?:.*warp\s*(?:factor\s*)?(\d+(?:\.\d+)?))?",
-            # "course to X"
-            r"course\s+(?:for|to)\s+(?:the\s+)?(\w+(?:\s+\w+)?)(?:.*warp\s*(?:factor\s*)?(\d+(?:\.\d+)?))?",
-            # "take us to X" / "head to X" / "go to X" / "let's go to X"
-            r"(?:take\s+us\s+to|head\s+(?:for|to)|go\s+to|let'?s\s+go\s+to)\s+(?:the\s+)?(\w+(?:\s+\w+)?)(?:.*warp\s*(?:factor\s*)?(\d+(?:\.\d+)?))?",
-            # "X warp Y" (destination then warp)
-            r"^(\w+(?:\s+\w+)?)\s+warp\s*(?:factor\s*)?(\d+(?:\.\d+)?)",
-            # Just destination name if it's a valid target
-            r"^(?:the\s+)?(\w+(?:\s+\w+)?)\s*$",
-        ]
 
-        for pattern in nav_patterns:
-            match = re.search(pattern, text_lower)
+        # Complex navigation patterns
+        for pattern in _NAV_PATTERNS:
+            match = pattern.search(text_lower)
             if match:
                 target_text = match.group(1).strip().lower()
                 warp = float(match.group(2)) if match.lastindex >= 2 and match.group(2) else 5.0
 
                 # Check if target is valid
-                if target_text in valid_targets:
-                    target = valid_targets[target_text]
+                if target_text in _VALID_TARGETS:
+                    target = _VALID_TARGETS[target_text]
                     return BridgeCommand("helm", "navigate", target, warp, None, None)
 
         return None
@@ -941,29 +1643,132 @@ ALWAYS output valid JSON. No explanation text. confidence should be 0.0-1.0 base
             print("  [QUICK MATCH] Recognized common command")
             return quick_match
 
-        # Build the prompt with context
+        # Reuse a previous interpretation of the same phrase in the same context
+        normalized = self._normalize(text)
+        signature = self.memory.signature()
+        cache_key = (normalized, signature)
+
+        # A prefetch of these exact words may already be asking Gemini
+        with self._cache_lock:
+            pending = self._inflight.get(cache_key)
+        if pending:
+            print("  [PREFETCH] Waiting for the early interpretation")
+            pending.wait(timeout=Config.SPECULATIVE_WAIT)
+
+        cached = self._cached(text, normalized, signature, cache_key)
+        if cached:
+            return cached
+
+        return self._query_gemini(text, normalized, signature, cache_key)
+
+    def prefetch(self, text: str):
+        """
+        Interpret a partial transcript ahead of time, so the final parse of
+        the same words is a cache hit instead of a Gemini request.
+
+        Only the Gemini path is prefetched, and nothing is printed; the
+        result is handed over through the in-memory response cache only, so
+        an interpretation of truncated words is never saved to disk or
+        reused for a merely similar phrase.
+
+        Args:
+            text: Partial transcription of an utterance still being spoken
+        """
+        if not Config.RESPONSE_CACHE_ENABLED or self._try_pattern_match(text):
+            return
+
+        normalized = self._normalize(text)
+        signature = self.memory.signature()
+        cache_key = (normalized, signature)
+        with self._cache_lock:
+            if cache_key in self._response_cache or cache_key in self._inflight:
+                return
+            done = self._inflight[cache_key] = threading.Event()
+
+        try:
+            self._query_gemini(text, normalized, signature, cache_key, speculative=True)
+        finally:
+            with self._cache_lock:
+                del self._inflight[cache_key]
+            done.set()
+
+    def _cached(self, text: str, normalized: str, signature: tuple, cache_key: tuple) -> Optional[BridgeCommand]:
+        """Look a command up in the response, saved and semantic caches."""
+        with self._cache_lock:
+            cached = self._response_cache.get(cache_key) if Config.RESPONSE_CACHE_ENABLED else None
+            if cached:
+                self._response_cache.move_to_end(cache_key)
+        if cached:
+            print("  [CACHE HIT] Reusing previous interpretation")
+            return cached
+
+        saved = self._response_store.lookup(normalized, signature) if self._response_store else None
+        if saved:
+            self._remember(cache_key, saved)
+            print("  [CACHE HIT] Reusing interpretation from an earlier session")
+            return saved
+
+        if self._semantic_cache:
+            with self._cache_lock:
+                similar = self._semantic_cache.lookup(normalized, text, signature)
+            if similar:
+                print("  [SEMANTIC HIT] Reusing interpretation of a similar phrase")
+                return similar
+
+        return None
+
+    def _query_gemini(self, text: str, normalized: str, signature: tuple, cache_key: tuple,
+                      speculative: bool = False) -> Optional[BridgeCommand]:
+        """
+        Ask Gemini to interpret a command and cache the result.
+
+        Args:
+            text: The transcribed voice command
+            normalized: Normalized text (cache key part)
+            signature: Memory signature (cache key part)
+            cache_key: Response cache key for this command
+            speculative: Interpreting a partial transcript (prefetch) - print
+                nothing, and keep the result only for an exact repeat of the
+                same words, never in the saved or semantic caches
+
+        Returns:
+            BridgeCommand if parsing succeeded, None otherwise
+        """
+
         context = self.memory.get_context_string()
-        system_prompt = self._build_system_prompt()
-        full_prompt = f"{system_prompt}\n\nContext: {context}\n\nCommand: \"{text}\"\n\nJSON:"
+
+        # Build the prompt (the system prompt is sent separately as a fixed
+        # prefix). Only the per-command parts go here, most volatile last,
+        # and the context line is left out entirely when there is none.
+        full_prompt = f"Command: \"{text}\"\nJSON:"
+        if context != CommandMemory.NO_CONTEXT:
+            full_prompt = f"Context: {context}\n{full_prompt}"
 
         try:
             # Call Gemini API
-            response = self.model.generate_content(
-                full_prompt,
-                generation_config=self.genai.types.GenerationConfig(
-                    temperature=0.1,  # Low temperature for consistent output
-                    max_output_tokens=150,  # Limit response length
-                )
-            )
+            try:
+                response = self.model.generate_content(
+                    full_prompt, generation_config=self._generation_config())
+            except self._api_exceptions.InvalidArgument as e:
+                if self._response_schema is None:
+                    raise
+                # Older API versions reject some schema features (HTTP 400) -
+                # retry without it, and stop sending it if that works. Other
+                # errors (network, quota) propagate with the schema kept.
+                response = self.model.generate_content(
+                    full_prompt, generation_config=self._generation_config(schema=False))
+                if not speculative:
+                    print(f"[GEMINI] Response schema not accepted, continuing without it: {e}")
+                self._response_schema = None
 
-            # Extract the response text
-            response_text = response.text.strip()
+            response_text = self._response_text(response)
 
             # Try to extract JSON from response
             json_data = self._extract_json(response_text)
 
             if not json_data:
-                print(f"  [ERROR] Could not parse JSON from: {response_text}")
+                if not speculative:
+                    print(f"  [ERROR] Could not parse JSON from: {response_text}")
                 return None
 
             # Check confidence (convert to float if string)
@@ -974,93 +1779,24 @@ ALWAYS output valid JSON. No explanation text. confidence should be 0.0-1.0 base
                 confidence = 0.5
 
             if confidence < Config.MIN_CONFIDENCE:
-                print(f"  [LOW CONFIDENCE] {confidence:.2f} < {Config.MIN_CONFIDENCE}")
-                print("  Please repeat your command more clearly.")
+                if not speculative:
+                    print(f"  [LOW CONFIDENCE] {confidence:.2f} < {Config.MIN_CONFIDENCE}")
+                    print("  Please repeat your command more clearly.")
                 return None
 
-            print(f"  [CONFIDENCE] {confidence:.2f}")
+            if not speculative:
+                print(f"  [CONFIDENCE] {confidence:.2f}")
 
             # Normalize intent (LLM sometimes returns variations)
-            intent = json_data.get('intent', 'stop')
-            intent_map = {
-                # Navigation variations
-                'navigation': 'navigate',
-                'set_course': 'navigate',
-                'course': 'navigate',
-                'go_to': 'navigate',
-                'goto': 'navigate',
-                'head_to': 'navigate',
-                'take_us_to': 'navigate',
-                'plot_course': 'navigate',
-                'lay_in_course': 'navigate',
-                # Warp variations
-                'engage': 'warp',
-                'engage_warp': 'warp',
-                'warp_speed': 'warp',
-                'increase_speed': 'warp',
-                'change_speed': 'warp',
-                # Stop variations
-                'full_stop': 'stop',
-                'all_stop': 'stop',
-                'halt': 'stop',
-                'hold': 'stop',
-                'hold_position': 'stop',
-                'drop_out': 'stop',
-                'exit_warp': 'stop',
-                # Shield variations
-                'shields_up': 'raise_shields',
-                'shields_down': 'lower_shields',
-                # Orbit variations
-                'enter_orbit': 'orbit',
-                'standard_orbit': 'orbit',
-                'establish_orbit': 'orbit',
-                # Status variations
-                'report': 'status',
-                'ship_status': 'status',
-                'status_report': 'status',
-                # Alert variations
-                'battlestations': 'red_alert',
-                'battle_stations': 'red_alert',
-                'condition_red': 'red_alert',
-                'condition_yellow': 'yellow_alert',
-                'condition_green': 'green_alert',
-                'stand_down': 'green_alert',
-                # Evasive variations
-                'evasive_maneuvers': 'evasive',
-                'evasive_action': 'evasive',
-                # Hail variations
-                'open_channel': 'hail',
-                'hail_ship': 'hail',
-                'on_screen': 'viewscreen',
-                'onscreen': 'viewscreen',
-                # Fire variations
-                'attack': 'fire',
-                'fire_weapons': 'fire',
-                'fire_phasers': 'fire',
-                'fire_torpedoes': 'fire',
-            }
-            intent = intent_map.get(intent, intent)
-
-            # Normalize target names
+            # Keys are lower-case, so canonicalize the value once ("Navigate")
+            intent = (json_data.get('intent') or 'stop').strip().lower()
+            intent = _INTENT_MAP.get(intent, intent)
+
+            # Normalize target names (same spoken-name table as the quick path)
             target = json_data.get('target')
             if target:
-                target_map = {
-                    'sol': 'Sun',
-                    'the sun': 'Sun',
-                    'terra': 'Earth',
-                    'home': 'Earth',
-                    'luna': 'Moon',
-                    'the moon': 'Moon',
-                    'starbase one': 'Starbase 1',
-                    'starbase': 'Starbase 1',
-                    'spacedock': 'Starbase 1',
-                    'space dock': 'Starbase 1',
-                    'deep space nine': 'Deep Space Nine',
-                    'deep space 9': 'Deep Space Nine',
-                    'ds9': 'Deep Space Nine',
-                }
-                target_lower = target.lower()
-                target = target_map.get(target_lower, target.capitalize())
+                target_lower = target.strip().lower()
+                target = _VALID_TARGETS.get(target_lower, target.capitalize())
                 json_data['target'] = target
 
             # Create command object
@@ -1073,125 +1809,509 @@ ALWAYS output valid JSON. No explanation text. confidence should be 0.0-1.0 base
                 maneuver=json_data.get('maneuver')
             )
 
+            # Never cache an answer the caller will reject (e.g. warp 12) -
+            # it would be replayed every time and Gemini never asked again.
+            # The caller validates again and reports why.
+            if not command.is_valid(verbose=False):
+                return command
+
+            if Config.RESPONSE_CACHE_ENABLED:
+                self._remember(cache_key, command)
+            if speculative:
+                # Only a final transcript of exactly these words may reuse it
+                return command
+            if self._response_store:
+                self._response_store.insert(normalized, signature, command)
+            if self._semantic_cache:
+                with self._cache_lock:
+                    self._semantic_cache.insert(normalized, text, signature, command)
+
             return command
 
         except Exception as e:
-            print(f"  [ERROR] Gemini request failed: {e}")
+            if not speculative:
+                print(f"  [ERROR] Gemini request failed: {e}")
             return None
 
+    def _remember(self, cache_key: tuple, command: BridgeCommand):
+        """Add a command to the in-memory cache, evicting the oldest entry when full."""
+        with self._cache_lock:
+            self._response_cache[cache_key] = command
+            if len(self._response_cache) > Config.RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+
+    def _response_text(self, response) -> str:
+        """
+        Text of Gemini's answer. The "}" stop sequence is left out of the
+        text, so it is restored when decoding stopped normally; anything
+        else (e.g. MAX_TOKENS) is returned as-is for _extract_json to judge.
+        Unlike response.text, never raises when the answer has no text.
+        """
+        if not response.candidates:
+            return ""
+        candidate = response.candidates[0]
+        text = "".join(getattr(part, "text", "") for part in candidate.content.parts).strip()
+        if getattr(candidate.finish_reason, "name", None) == "STOP" and not text.endswith("}"):
+            text += "}"
+        return text
+
+    def _generation_config(self, schema: bool = True):
+        """Decoding settings for command parsing (optionally schema-constrained)."""
+        return self.genai.types.GenerationConfig(
+            temperature=0.1,  # Low temperature for consistent output
+            top_k=10,  # Only the most likely tokens - output shape is fixed
+            top_p=0.5,
+            # A command object is ~30-45 tokens and the stop sequence ends it,
+            # but 2.5 models count their thinking against this limit too
+            max_output_tokens=1024,
+            candidate_count=1,  # One answer only - never decode alternatives
+            stop_sequences=["}"],  # Stop decoding as soon as the object closes
+            response_mime_type="application/json",  # Constrained JSON-only decoding
+            response_schema=self._response_schema if schema else None,
+        )
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """
+        Normalize a command for cache lookup (Unicode form, case, punctuation,
+        spacing). Decimal points are kept, so different numbers never share
+        a cache entry:
+
+        >>> IntentParser._normalize("Set impulse to 2.5 percent.")
+        'set impulse to 2.5 percent'
+        >>> IntentParser._normalize("Set impulse to 25 percent!")
+        'set impulse to 25 percent'
+        >>> IntentParser._normalize("Warp 9.9.")
+        'warp 9.9'
+        """
+        text = unicodedata.normalize("NFC", text).lower().translate(_PUNCTUATION_EXCEPT_DOT_TABLE)
+        return " ".join(_RE_STRAY_DOT.sub("", text).split())
+
     def _extract_json(self, text: str) -> Optional[Dict[str, Any]]:
         """
         Extract JSON from the LLM response.
 
-        The LLM might include extra text, so we try to find and parse the JSON.
+        Responses are requested in JSON mode, so the object normally starts
+        the text; decoding from the first brace also handles a model that
+        still wraps it in extra text, with a single parse either way.
         """
-        # First, try parsing the whole thing
-        try:
-            return json.loads(text)
-        except json.JSONDecodeError:
-            pass
-
-        # Try to find JSON in the text
         start_idx = text.find('{')
-        end_idx = text.rfind('}')
+        if start_idx == -1:
+            return None
 
-        if start_idx != -1 and end_idx != -1:
-            try:
-                return json.loads(text[start_idx:end_idx + 1])
-            except json.JSONDecodeError:
-                pass
+        try:
+            # raw_decode stops at the end of the object and ignores what follows
+            data, _ = _JSON_DECODER.raw_decode(text, start_idx)
+        except json.JSONDecodeError:
+            return None
 
-        return None
+        return data if isinstance(data, dict) else None
 
 
 # =============================================================================
 # TCP CLIENT - Send commands to Godot
 # =============================================================================
 
+# Message of the receipt bridge_ai_receiver.gd sends before running a command
+# (the command's actual result follows on its own line)
+_GODOT_RECEIPT_MESSAGE = "Command received"
+
+
 class GodotClient:
     """
     TCP client for communicating with the Godot game.
 
-    Sends JSON commands and waits for acknowledgment.
+    Sends JSON commands. Godot acknowledges every command; by default those
+    acknowledgments are collected without blocking, so sending never waits
+    on the game. Set Config.ACK_REQUIRED to wait for each one instead.
+
+    Without ACK_REQUIRED, commands are handed to a background writer thread
+    that owns the socket, so the voice pipeline never waits on the network.
+    Delivery failures are reported on the next send.
+
+    Godot answers each valid command with two lines, in order: a receipt
+    ("Command received", sent by bridge_ai_receiver.gd before the command
+    runs) and then the command handler's result. A command the receiver
+    cannot parse gets a single failure line instead. Commands are answered
+    in the order they were sent, so each result belongs to the oldest
+    command still awaiting one; a rejected command is reported by name.
+
+    After start(), a background thread keeps the connection up, retrying
+    with exponential backoff while the game is not running, so a send never
+    waits on a connection attempt.
     """
 
     def __init__(self):
         self.host = Config.GODOT_HOST
         self.port = Config.GODOT_PORT
+        self._address: Optional[tuple] = None  # Resolved (family, sockaddr), reused on reconnect
         self.socket: Optional[socket.socket] = None
         self.connected = False
-
-    def connect(self) -> bool:
+        self._selector = selectors.DefaultSelector()
+        self._rx_buffer = bytearray()  # Received bytes not yet ending in a newline
+        self._recv_buffer = bytearray(4096)  # Reused for every read from the socket
+        self._recv_view = memoryview(self._recv_buffer)
+        self._unacked: "deque[BridgeCommand]" = deque()  # Sent, oldest first, awaiting a result
+        self._head_received = False  # Godot's receipt for _unacked[0] has arrived
+        self._rejected = 0  # Commands Godot has refused so far
+
+        # Background writer (used when acknowledgments are not required)
+        self._tx_queue: "queue.Queue[Optional[BridgeCommand]]" = queue.Queue()
+        self._failed: "queue.Queue[BridgeCommand]" = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
+
+        # Background reconnector (see start); the lock serializes socket use
+        # between it, the writer thread and synchronous sends
+        self._lock = threading.RLock()
+        self._connected_event = threading.Event()
+        self._connection_lost = threading.Event()  # Wakes the reconnector
+        self._stopping = threading.Event()
+        self._reconnect_thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Connect now if the game is up, and keep reconnecting in the background."""
+        self.connect()
+        self._reconnect_thread = threading.Thread(target=self._reconnect_loop, daemon=True)
+        self._reconnect_thread.start()
+
+    def _reconnect_loop(self):
+        """Reconnector thread: restore a lost connection, backing off between attempts."""
+        attempt = 0
+        while not self._stopping.is_set():
+            if self.connected:
+                attempt = 0
+                self._connection_lost.wait()
+                self._connection_lost.clear()
+                continue
+
+            with self._lock:
+                # start() (or the failed send) already reported the outage
+                connected = self.connected or self.connect(quiet=True)
+            if not connected:
+                self._stopping.wait(min(Config.RECONNECT_MAX_DELAY, 0.5 * 2 ** attempt))
+                attempt += 1
+
+    def connect(self, quiet: bool = False) -> bool:
         """
         Connect to the Godot TCP server.
 
+        Args:
+            quiet: Don't report a failed attempt (background retries)
+
         Returns:
             True if connected successfully, False otherwise
         """
+        self._close_socket()
+
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            if self._address is None:
+                # Resolve once (IPv4 or IPv6); reconnects skip getaddrinfo
+                family, _, _, _, sockaddr = socket.getaddrinfo(
+                    self.host, self.port, socket.AF_UNSPEC, socket.SOCK_STREAM)[0]
+                self._address = (family, sockaddr)
+            family, sockaddr = self._address
+
+            self.socket = socket.socket(family, socket.SOCK_STREAM)
+            # Commands are tiny - send them immediately instead of letting
+            # Nagle's algorithm hold them back waiting for more data
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Detect a dead game connection even while no commands are sent
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, "TCP_QUICKACK"):  # Linux only
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+            # Set once here; acknowledgment waits go through the selector
             self.socket.settimeout(5.0)
-            self.socket.connect((self.host, self.port))
+            self.socket.connect(sockaddr)
+            self._selector.register(self.socket, selectors.EVENT_READ)
             self.connected = True
+            self._connected_event.set()
             print(f"[TCP] Connected to Godot at {self.host}:{self.port}")
             return True
         except socket.error as e:
-            print(f"[TCP] Could not connect to Godot: {e}")
-            print("  Make sure the game is running with the TCP listener enabled.")
-            self.connected = False
+            if not quiet:
+                print(f"[TCP] Could not connect to Godot: {e}")
+                print("  Make sure the game is running with the TCP listener enabled.")
+            self._address = None  # Resolve again next time, in case it changed
+            self._close_socket()
             return False
 
     def send_command(self, command: BridgeCommand) -> bool:
         """
-        Send a command to Godot and wait for acknowledgment.
+        Send a command to Godot.
 
         Args:
             command: The validated command to send
 
         Returns:
-            True if command was sent and acknowledged, False otherwise
+            True if command was sent (and acknowledged, when
+            Config.ACK_REQUIRED is set), False otherwise
+        """
+        return self.send_commands([command])
+
+    def send_commands(self, commands: list) -> bool:
+        """
+        Send several commands to Godot in a single write.
+
+        Args:
+            commands: The validated commands to send, in order
+
+        Returns:
+            True if all commands were sent (and acknowledged, when
+            Config.ACK_REQUIRED is set), False otherwise. Without
+            ACK_REQUIRED, True means the commands were queued for the
+            writer thread.
         """
+        if Config.ACK_REQUIRED:
+            return self._send_now(commands)
+
+        self._report_failures()
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer_thread.start()
+        for command in commands:
+            self._tx_queue.put(command)
+        return True
+
+    def _writer_loop(self):
+        """Writer thread: send queued commands, coalescing any backlog into one write."""
+        while True:
+            # While acknowledgments are outstanding, check for them between
+            # commands so a rejection is reported without waiting for the next one
+            try:
+                command = self._tx_queue.get(timeout=0.05 if self._unacked else None)
+            except queue.Empty:
+                with self._lock:
+                    try:
+                        if self.connected:
+                            self._read_acks(timeout=0)
+                    except socket.error:
+                        self._close_socket()
+                    except Exception as e:
+                        print(f"[TCP] Writer error: {e!r}")
+                continue
+            if command is None:
+                return
+
+            batch = [command]
+            stop = False
+            try:
+                while True:
+                    command = self._tx_queue.get_nowait()
+                    if command is None:
+                        stop = True
+                        break
+                    batch.append(command)
+            except queue.Empty:
+                pass
+
+            try:
+                sent = self._send_now(batch)
+            except Exception as e:
+                # Anything but a socket error (handled inside) is a bug in
+                # encoding or bookkeeping - report it and keep the thread alive
+                print(f"[TCP] Writer error: {e!r}")
+                sent = False
+            if not sent:
+                for command in batch:
+                    self._failed.put(command)
+            if stop:
+                return
+
+    def _report_failures(self):
+        """Print commands the writer thread could not deliver."""
+        try:
+            while True:
+                command = self._failed.get_nowait()
+                print(f"[FAILED] Earlier command was not delivered: {command.department} → {command.intent}")
+        except queue.Empty:
+            pass
+
+    def _send_now(self, commands: list) -> bool:
+        """Write commands to the socket on the calling thread (see send_commands)."""
+        if not commands:
+            return True
+
+        if not self.connected and self._reconnect_thread:
+            # The reconnector is on it - give it a moment instead of
+            # paying for a connection attempt here
+            self._connected_event.wait(timeout=Config.RECONNECT_WAIT)
+
+        with self._lock:
+            return self._send_locked(commands)
+
+    def _send_locked(self, commands: list) -> bool:
+        """Body of _send_now, run while holding the socket lock."""
         if not self.connected:
+            if self._reconnect_thread:
+                print("[TCP] Not connected to Godot (retrying in the background)")
+                return False
             if not self.connect():
                 return False
 
         try:
-            # Convert command to JSON
-            json_str = command.to_json()
-
-            # Send with newline delimiter
-            message = json_str + "\n"
-            self.socket.sendall(message.encode('utf-8'))
+            # Pick up acknowledgments of earlier commands (never blocks). Drain
+            # until empty so a close from the game is noticed before sending.
+            while self._selector.select(0):
+                self._read_acks(timeout=0)
+        except socket.error:
+            # The game went away since the last command - reconnect once
+            if not self.connect():
+                return False
 
-            print(f"[SENT] {json_str}")
+        # Encode each command as a newline-terminated frame; every frame
+        # goes out in one write
+        frames = [command.to_bytes() for command in commands]
 
-            # Wait for acknowledgment
-            self.socket.settimeout(5.0)
-            response = self.socket.recv(1024).decode('utf-8').strip()
-
-            if response:
-                print(f"[ACK] {response}")
-                return True
-            else:
-                print("[ACK] Empty response")
+        try:
+            try:
+                self._write_frames(frames)
+            except socket.timeout:
+                raise
+            except socket.error as e:
+                # Broken pipe / reset: the game restarted - reconnect and resend once
+                print(f"[TCP] Connection lost ({e}), reconnecting...")
+                if not self.connect():
+                    return False
+                self._write_frames(frames)
+
+            for frame in frames:
+                print(f"[SENT] {frame[:-1].decode('utf-8')}")
+            self._unacked.extend(commands)
+
+            if not Config.ACK_REQUIRED:
                 return True
 
+            # Wait for each command's result
+            rejected = self._rejected
+            acked = 0
+            deadline = time.monotonic() + Config.ACK_TIMEOUT
+            while acked < len(commands):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    print("[TCP] Timeout waiting for acknowledgment")
+                    return False
+                acked += self._read_acks(timeout=remaining)
+            return self._rejected == rejected
+
         except socket.timeout:
-            print("[TCP] Timeout waiting for acknowledgment")
+            print("[TCP] Timeout sending command")
             return False
         except socket.error as e:
             print(f"[TCP] Connection error: {e}")
-            self.connected = False
+            self._close_socket()
             return False
 
-    def disconnect(self):
-        """Close the connection to Godot."""
+    def _write_frames(self, frames: list):
+        """
+        Write frames in one vectored send (no joined copy), finishing any
+        remainder with sendall. Platforms without sendmsg join and sendall.
+        """
+        if not hasattr(self.socket, "sendmsg"):  # Windows
+            self.socket.sendall(b"".join(frames))
+            return
+
+        sent = self.socket.sendmsg(frames)
+        total = sum(len(frame) for frame in frames)
+        if sent < total:
+            self.socket.sendall(b"".join(frames)[sent:])
+
+    def _read_acks(self, timeout: float) -> int:
+        """
+        Read and log acknowledgments waiting on the socket.
+
+        Godot ends every acknowledgment with a newline. Only complete lines
+        are counted; a line split across reads waits in the receive buffer
+        for the rest, so it is never counted twice or cut short.
+
+        A receipt does not settle a command - its result line follows. If a
+        second receipt arrives first, the game has no command handler, and
+        the earlier command counts as accepted on its receipt alone.
+
+        Args:
+            timeout: Seconds to wait for data (0 = only what already arrived)
+
+        Returns:
+            Number of commands settled by a result (0 if none arrived)
+        """
+        if not self._selector.select(timeout):
+            return 0
+
+        # Read into the reusable buffer rather than a fresh bytes per read
+        n = self.socket.recv_into(self._recv_view)
+        if not n:
+            raise ConnectionResetError("Godot closed the connection")
+
+        self._rx_buffer += self._recv_view[:n]
+        end = self._rx_buffer.rfind(b"\n")
+        if end == -1:
+            return 0
+        lines = self._rx_buffer[:end].split(b"\n")
+        del self._rx_buffer[:end + 1]
+
+        acks = 0
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            text = line.decode('utf-8', errors='replace')
+            try:
+                ack = json.loads(text)
+            except json.JSONDecodeError:
+                ack = None
+
+            if (isinstance(ack, dict) and ack.get("success") is True
+                    and ack.get("message") == _GODOT_RECEIPT_MESSAGE):
+                if self._head_received and self._unacked:
+                    # The previous command never got a result line
+                    self._unacked.popleft()
+                    acks += 1
+                self._head_received = bool(self._unacked)
+                continue
+
+            acks += 1
+            command = self._unacked.popleft() if self._unacked else None
+            self._head_received = False
+            if isinstance(ack, dict) and ack.get("success") is False:
+                self._rejected += 1
+                name = f"{command.department} → {command.intent}" if command else "command"
+                print(f"[REJECTED] Godot refused {name}: {ack.get('message', 'no reason given')}")
+            else:
+                print(f"[ACK] {text}")
+        return acks
+
+    def _close_socket(self):
+        """Close and forget the current socket, if any."""
         if self.socket:
+            try:
+                self._selector.unregister(self.socket)
+            except (KeyError, ValueError):
+                pass
             try:
                 self.socket.close()
             except:
                 pass
+        self.socket = None
         self.connected = False
+        self._connected_event.clear()
+        self._connection_lost.set()
+        self._rx_buffer.clear()
+        self._unacked.clear()  # Acknowledgments for the old connection never arrive
+        self._head_received = False
+
+    def disconnect(self):
+        """Flush queued commands, then close the connection to Godot."""
+        if self._writer_thread:
+            self._tx_queue.put(None)
+            self._writer_thread.join(timeout=Config.ACK_TIMEOUT)
+            self._writer_thread = None
+        if self._reconnect_thread:
+            self._stopping.set()
+            self._connection_lost.set()
+            self._reconnect_thread.join(timeout=1)
+            self._reconnect_thread = None
+        self._report_failures()
+        with self._lock:
+            self._close_socket()
         print("[TCP] Disconnected")
 
 
@@ -1224,6 +2344,21 @@ class BridgeAI:
 
         self.running = False
 
+        # Pipeline stages: capture thread -> audio_queue -> transcribe thread
+        # -> text_queue -> main thread (parse + send). Bounded so an earlier
+        # stage pauses (backpressure) if a later one falls behind.
+        self.audio_queue: "queue.Queue[bytes]" = queue.Queue(maxsize=Config.PIPELINE_QUEUE_DEPTH)
+        self.text_queue: "queue.Queue[str]" = queue.Queue(maxsize=Config.PIPELINE_QUEUE_DEPTH)
+        self._capture_thread: Optional[threading.Thread] = None
+        self._transcribe_thread: Optional[threading.Thread] = None
+
+        # Partial transcriptions run on one worker so they overlap speech
+        # without holding up recording
+        self._partial_executor: Optional[ThreadPoolExecutor] = None
+        self._partial_future = None
+        if Config.PARTIAL_TRANSCRIPTION:
+            self._partial_executor = ThreadPoolExecutor(max_workers=1)
+
         print("=" * 60)
         print("Bridge AI Ready!")
         print("=" * 60)
@@ -1236,15 +2371,37 @@ class BridgeAI:
             True if a command was successfully processed, False otherwise
         """
         # Step 1: Record audio
-        audio_data = self.recorder.record_until_silence()
+        try:
+            audio_data = self.recorder.record_until_silence()
+        except OSError as e:
+            print(f"ERROR: {e}")
+            return False
         if not audio_data:
             return False
 
+        return self.process_audio(audio_data)
+
+    def process_audio(self, audio_data: bytes) -> bool:
+        """
+        Process one recorded utterance: transcribe, parse, validate and send.
+
+        Returns:
+            True if a command was successfully processed, False otherwise
+        """
         # Step 2: Transcribe to text
         text = self.transcriber.transcribe(audio_data)
         if not text:
             return False
 
+        return self.process_text(text)
+
+    def process_text(self, text: str) -> bool:
+        """
+        Process one transcribed utterance: parse, validate and send.
+
+        Returns:
+            True if a command was successfully processed, False otherwise
+        """
         # Step 3: Parse into command
         command = self.parser.parse(text)
         if not command:
@@ -1268,6 +2425,59 @@ class BridgeAI:
             print("[FAILED] Could not send to Godot")
             return False
 
+    def _capture_loop(self):
+        """
+        Record utterances continuously on a background thread.
+
+        Runs concurrently with the transcribe and parse stages, so the next
+        command can be captured while the previous one is still being
+        transcribed, parsed and sent.
+        """
+        while self.running:
+            try:
+                on_partial = self._on_partial_audio if self._partial_executor else None
+                audio_data = self.recorder.record_until_silence(on_partial)
+                # No pause before listening again: record_until_silence blocks
+                # on the microphone callback until speech starts. A microphone
+                # that can't be opened raises, and backs off below.
+                if audio_data and self.running:
+                    self.audio_queue.put(audio_data)
+            except Exception as e:
+                print(f"[ERROR] {e}")
+                time.sleep(1)
+
+    def _on_partial_audio(self, audio_data: bytes):
+        """Recorder callback: transcribe the audio so far unless one is in flight."""
+        if self._partial_future and not self._partial_future.done():
+            return
+        self._partial_future = self._partial_executor.submit(self._show_partial, audio_data)
+
+    def _show_partial(self, audio_data: bytes):
+        """
+        Print the partial transcription of an utterance still being spoken,
+        and start interpreting it in case the speaker has finished.
+        """
+        text = self.transcriber.transcribe_partial(audio_data)
+        if text:
+            print(f"  [PARTIAL] \"{text}\"")
+            if Config.SPECULATIVE_PARSE:
+                self.parser.prefetch(text)
+
+    def _transcribe_loop(self):
+        """Transcribe recorded utterances on a background thread."""
+        while self.running:
+            try:
+                audio_data = self.audio_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            try:
+                text = self.transcriber.transcribe(audio_data)
+                if text and self.running:
+                    self.text_queue.put(text)
+            except Exception as e:
+                print(f"[ERROR] {e}")
+
     def run(self):
         """
         Main loop - continuously listen for and process commands.
@@ -1281,19 +2491,29 @@ class BridgeAI:
         print("Press Ctrl+C to stop")
         print("=" * 60)
 
-        # Try to connect to Godot at startup
-        self.godot.connect()
+        # Connect to Godot at startup (and keep reconnecting if it restarts)
+        self.godot.start()
+
+        # Recording and transcription run on their own threads; parsing and
+        # sending stay on this one
+        self._capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._transcribe_thread = threading.Thread(target=self._transcribe_loop, daemon=True)
+        self._capture_thread.start()
+        self._transcribe_thread.start()
 
         try:
             while self.running:
                 try:
-                    self.process_voice_command()
-                    time.sleep(0.5)  # Brief pause between commands
+                    text = self.text_queue.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+
+                try:
+                    self.process_text(text)
                 except KeyboardInterrupt:
                     raise
                 except Exception as e:
                     print(f"[ERROR] {e}")
-                    time.sleep(1)
         except KeyboardInterrupt:
             print("\n\n[SHUTDOWN] Bridge AI shutting down...")
         finally:
@@ -1302,7 +2522,20 @@ class BridgeAI:
     def cleanup(self):
         """Release all resources."""
         self.running = False
+
+        # Let the capture thread leave PortAudio before it is terminated
+        self.recorder.stop()
+        if self._capture_thread:
+            self._capture_thread.join(timeout=2)
+        # Don't unload the model while an utterance is still being transcribed
+        if self._transcribe_thread:
+            self._transcribe_thread.join(timeout=5)
+        if self._partial_executor:
+            self._partial_executor.shutdown(wait=True)
+
         self.recorder.cleanup()
+        self.transcriber.cleanup()
+        self.parser.cleanup()
         self.godot.disconnect()
         print("[SHUTDOWN] Complete.")
 